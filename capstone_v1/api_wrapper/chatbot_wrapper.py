@@ -63,6 +63,8 @@ class ChatbotWrapper:
         openai_api_key: Optional[str] = None,
         use_local_hf: bool = False,
         hf_device: str = "auto",
+        hf_quantization: Optional[str] = None,
+        hf_backend: str = "transformers",
         enable_retry: bool = True,
         enable_rate_limiting: bool = True,
         enable_caching: bool = True,
@@ -77,6 +79,8 @@ class ChatbotWrapper:
             openai_api_key: OpenAI API key (optional)
             use_local_hf: Use local HuggingFace models instead of API
             hf_device: Device for local HuggingFace models ('cpu', 'cuda', 'auto')
+            hf_quantization: Quantize local HuggingFace weights on CUDA ('int8', 'nf4', or None)
+            hf_backend: Local HuggingFace inference backend ('transformers', 'vllm', 'tgi')
             enable_retry: Enable automatic retry on failures (default: True)
             enable_rate_limiting: Enable rate limiting (default: True)
             enable_caching: Enable response caching (default: True)
@@ -123,7 +127,11 @@ class ChatbotWrapper:
         if huggingface_api_key or use_local_hf:
             try:
                 self.hf_client = HuggingFaceClient(
-                    api_key=huggingface_api_key, use_local=use_local_hf, device=hf_device
+                    api_key=huggingface_api_key,
+                    use_local=use_local_hf,
+                    device=hf_device,
+                    quantization=hf_quantization,
+                    backend=hf_backend,
                 )
                 self.logger.info("HuggingFace client initialized successfully")
             except Exception as e:
@@ -507,8 +515,8 @@ class ChatbotWrapper:
                     }
                 result["license"] = model_info.license.value if model_info.license else None
                 result["free_tier_available"] = model_info.free_tier_available
-                result["recommended_use_cases"] = model_info.recommended_use_cases
-                result["limitations"] = model_info.limitations
+                result["recommended_use_cases"] = list(model_info.recommended_use_cases)
+                result["limitations"] = list(model_info.limitations)
                 result["documentation_url"] = model_info.documentation_url
                 return result
         except ImportError:
@@ -517,9 +525,9 @@ class ChatbotWrapper:
         
         # Fallback to basic config
         if model in HUGGINGFACE_CHATBOT_MODELS:
-            return HUGGINGFACE_CHATBOT_MODELS[model]
+            return HUGGINGFACE_CHATBOT_MODELS[model].to_dict()
         elif model in OPENAI_CHATBOT_MODELS:
-            return OPENAI_CHATBOT_MODELS[model]
+            return OPENAI_CHATBOT_MODELS[model].to_dict()
         else:
             return {"error": "Model not found in configuration"}
 
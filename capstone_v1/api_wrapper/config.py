@@ -9,7 +9,9 @@ licensing, and use cases, see the models registry:
 """
 
 import os
-from typing import Dict, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 # HuggingFace Configuration
 HUGGINGFACE_API_KEY: Optional[str] = os.getenv("HUGGINGFACE_API_KEY")
@@ -19,79 +21,104 @@ HUGGINGFACE_API_URL: str = "https://api-inference.huggingface.co/models"
 OPENAI_API_KEY: Optional[str] = os.getenv("OPENAI_API_KEY")
 OPENAI_API_BASE: str = "https://api.openai.com/v1"
 
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Basic model description used by the built-in model lists"""
+    __slots__ = ("name", "provider", "description", "type")
+
+    name: str
+    provider: str
+    description: str
+    type: Optional[str]
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the spec in the plain dict form used by get_model_info"""
+        info = {"name": self.name, "provider": self.provider}
+        if self.type is not None:
+            info["type"] = self.type
+        info["description"] = self.description
+        return info
+
+
 # Specialized Chatbot Models
-HUGGINGFACE_CHATBOT_MODELS: Dict[str, Dict] = {
-    "meta-llama/Llama-2-7b-chat-hf": {
-        "name": "Llama 2 7B Chat",
-        "provider": "huggingface",
-        "type": "inference",
-        "description": "Meta's Llama 2 7B chat model",
-    },
-    "meta-llama/Llama-2-13b-chat-hf": {
-        "name": "Llama 2 13B Chat",
-        "provider": "huggingface",
-        "type": "inference",
-        "description": "Meta's Llama 2 13B chat model",
-    },
-    "mistralai/Mistral-7B-Instruct-v0.2": {
-        "name": "Mistral 7B Instruct",
-        "provider": "huggingface",
-        "type": "inference",
-        "description": "Mistral AI's 7B instruction-tuned model",
-    },
-    "microsoft/DialoGPT-large": {
-        "name": "DialoGPT Large",
-        "provider": "huggingface",
-        "type": "inference",
-        "description": "Microsoft's conversational AI model",
-    },
-    "google/flan-t5-xxl": {
-        "name": "FLAN-T5 XXL",
-        "provider": "huggingface",
-        "type": "inference",
-        "description": "Google's instruction-tuned T5 model",
-    },
-    "HuggingFaceH4/zephyr-7b-beta": {
-        "name": "Zephyr 7B Beta",
-        "provider": "huggingface",
-        "type": "inference",
-        "description": "HuggingFace's Zephyr instruction-tuned model",
-    },
-    "meta-llama/Meta-Llama-3-8B-Instruct": {
-        "name": "Llama 3 8B Instruct",
-        "provider": "huggingface",
-        "type": "inference",
-        "description": "Meta's Llama 3 8B instruction model",
-    },
-}
+HUGGINGFACE_CHATBOT_MODELS: Mapping[str, ModelSpec] = MappingProxyType({
+    "meta-llama/Llama-2-7b-chat-hf": ModelSpec(
+        name="Llama 2 7B Chat",
+        provider="huggingface",
+        type="inference",
+        description="Meta's Llama 2 7B chat model",
+    ),
+    "meta-llama/Llama-2-13b-chat-hf": ModelSpec(
+        name="Llama 2 13B Chat",
+        provider="huggingface",
+        type="inference",
+        description="Meta's Llama 2 13B chat model",
+    ),
+    "mistralai/Mistral-7B-Instruct-v0.2": ModelSpec(
+        name="Mistral 7B Instruct",
+        provider="huggingface",
+        type="inference",
+        description="Mistral AI's 7B instruction-tuned model",
+    ),
+    "microsoft/DialoGPT-large": ModelSpec(
+        name="DialoGPT Large",
+        provider="huggingface",
+        type="inference",
+        description="Microsoft's conversational AI model",
+    ),
+    "google/flan-t5-xxl": ModelSpec(
+        name="FLAN-T5 XXL",
+        provider="huggingface",
+        type="inference",
+        description="Google's instruction-tuned T5 model",
+    ),
+    "HuggingFaceH4/zephyr-7b-beta": ModelSpec(
+        name="Zephyr 7B Beta",
+        provider="huggingface",
+        type="inference",
+        description="HuggingFace's Zephyr instruction-tuned model",
+    ),
+    "meta-llama/Meta-Llama-3-8B-Instruct": ModelSpec(
+        name="Llama 3 8B Instruct",
+        provider="huggingface",
+        type="inference",
+        description="Meta's Llama 3 8B instruction model",
+    ),
+})
 
-OPENAI_CHATBOT_MODELS: Dict[str, Dict] = {
-    "gpt-4": {
-        "name": "GPT-4",
-        "provider": "openai",
-        "description": "OpenAI's most capable model",
-    },
-    "gpt-4-turbo": {
-        "name": "GPT-4 Turbo",
-        "provider": "openai",
-        "description": "Faster and more capable GPT-4 variant",
-    },
-    "gpt-4-turbo-preview": {
-        "name": "GPT-4 Turbo Preview",
-        "provider": "openai",
-        "description": "Preview version of GPT-4 Turbo",
-    },
-    "gpt-3.5-turbo": {
-        "name": "GPT-3.5 Turbo",
-        "provider": "openai",
-        "description": "Fast and efficient GPT-3.5 model",
-    },
-    "gpt-3.5-turbo-16k": {
-        "name": "GPT-3.5 Turbo 16K",
-        "provider": "openai",
-        "description": "GPT-3.5 with extended context window",
-    },
-}
+OPENAI_CHATBOT_MODELS: Mapping[str, ModelSpec] = MappingProxyType({
+    "gpt-4": ModelSpec(
+        name="GPT-4",
+        provider="openai",
+        type=None,
+        description="OpenAI's most capable model",
+    ),
+    "gpt-4-turbo": ModelSpec(
+        name="GPT-4 Turbo",
+        provider="openai",
+        type=None,
+        description="Faster and more capable GPT-4 variant",
+    ),
+    "gpt-4-turbo-preview": ModelSpec(
+        name="GPT-4 Turbo Preview",
+        provider="openai",
+        type=None,
+        description="Preview version of GPT-4 Turbo",
+    ),
+    "gpt-3.5-turbo": ModelSpec(
+        name="GPT-3.5 Turbo",
+        provider="openai",
+        type=None,
+        description="Fast and efficient GPT-3.5 model",
+    ),
+    "gpt-3.5-turbo-16k": ModelSpec(
+        name="GPT-3.5 Turbo 16K",
+        provider="openai",
+        type=None,
+        description="GPT-3.5 with extended context window",
+    ),
+})
 
 # Default model parameters
 DEFAULT_TEMPERATURE: float = 0.7
@@ -1,12 +1,15 @@
 """
 Comprehensive Examples for the Chatbot API Wrapper
 Covers various use cases, domains, and integration patterns
+
+Run from the project root as: python -m api_wrapper.examples
 """
 
+import importlib.util
 import os
 import sys
-from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import pandas as pd
@@ -15,10 +18,7 @@ except ImportError:
     PANDAS_AVAILABLE = False
     print("Note: pandas not available for dataset examples")
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))  # noqa: E402
-
-from api_wrapper import ChatbotWrapper  # noqa: E402
+from api_wrapper import ChatbotWrapper
 try:
     from api_wrapper.starter_prompts import get_prompt, list_available_prompts
     PROMPTS_AVAILABLE = True
@@ -33,20 +33,22 @@ except ImportError:
     DATASETS_AVAILABLE = False
     print("Note: dataset_loaders module not available")
 
-try:
-    from models.models_registry import (
-        get_model_info,
-        list_models_by_provider,
-        list_models_by_type,
-        search_models,
-        get_free_models,
-        get_local_models,
-        ModelType,
-        ALL_MODELS,
-    )
-    MODELS_REGISTRY_AVAILABLE = True
-except ImportError:
-    MODELS_REGISTRY_AVAILABLE = False
+# Canonical message keys and roles shared by the message-list examples
+KEY_ROLE = sys.intern("role")
+KEY_CONTENT = sys.intern("content")
+ROLE_SYSTEM = sys.intern("system")
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+
+
+def _msg(role: str, content: str) -> dict:
+    """Build a chat message dict using the canonical key/role strings"""
+    return {KEY_ROLE: role, KEY_CONTENT: content}
+
+
+# The models registry is only imported by the examples that use it
+MODELS_REGISTRY_AVAILABLE = importlib.util.find_spec("models") is not None
+if not MODELS_REGISTRY_AVAILABLE:
     print("Note: models registry not available")
 
 
@@ -180,10 +182,10 @@ def example_message_format():
 
     # Use proper message format
     messages = [
-        {"role": "system", "content": "You are a helpful assistant."},
-        {"role": "user", "content": "What is Python?"},
-        {"role": "assistant", "content": "Python is a programming language."},
-        {"role": "user", "content": "What are its main features?"},
+        _msg(ROLE_SYSTEM, "You are a helpful assistant."),
+        _msg(ROLE_USER, "What is Python?"),
+        _msg(ROLE_ASSISTANT, "Python is a programming language."),
+        _msg(ROLE_USER, "What are its main features?"),
     ]
 
     response = wrapper.chat(
@@ -230,25 +232,32 @@ def example_domain_specific():
 
     wrapper = ChatbotWrapper(openai_api_key=os.getenv("OPENAI_API_KEY"))
 
-    # Data Science Assistant
-    print("\n--- Data Science Assistant ---")
     ds_conv = wrapper.conversation(
         model="gpt-3.5-turbo",
         system_prompt=get_prompt("data_science"),
     )
-    response = ds_conv.send("What's the difference between L1 and L2 regularization?")
-    print("Q: What's the difference between L1 and L2 regularization?")
-    print(f"A: {response[:150]}...\n")
-
-    # Math Tutor
-    print("\n--- Math Tutor ---")
     math_conv = wrapper.conversation(
         model="gpt-3.5-turbo",
         system_prompt=get_prompt("math"),
     )
-    response = math_conv.send("Explain the chain rule in calculus")
-    print("Q: Explain the chain rule in calculus")
-    print(f"A: {response[:150]}...\n")
+
+    # The two conversations are independent, so send both requests at once
+    ds_question = "What's the difference between L1 and L2 regularization?"
+    math_question = "Explain the chain rule in calculus"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        ds_future = executor.submit(ds_conv.send, ds_question)
+        math_future = executor.submit(math_conv.send, math_question)
+        ds_response, math_response = ds_future.result(), math_future.result()
+
+    # Data Science Assistant
+    print("\n--- Data Science Assistant ---")
+    print(f"Q: {ds_question}")
+    print(f"A: {ds_response[:150]}...\n")
+
+    # Math Tutor
+    print("\n--- Math Tutor ---")
+    print(f"Q: {math_question}")
+    print(f"A: {math_response[:150]}...\n")
 
 
 def example_temperature_variations():
@@ -372,29 +381,26 @@ def example_provider_comparison():
 
     prompt = "Explain what Python is in one sentence."
 
+    def ask(model, provider):
+        try:
+            response = wrapper.chat(model=model, messages=prompt, provider=provider)
+            return f"Response: {response['response']}\n"
+        except Exception as e:
+            return f"Error: {e}\n"
+
+    # Query both providers concurrently; the calls are independent
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        openai_future = executor.submit(ask, "gpt-3.5-turbo", "openai")
+        hf_future = executor.submit(ask, "mistralai/Mistral-7B-Instruct-v0.2", "huggingface")
+        openai_result, hf_result = openai_future.result(), hf_future.result()
+
     # OpenAI
     print("\n--- OpenAI (gpt-3.5-turbo) ---")
-    try:
-        response_openai = wrapper.chat(
-            model="gpt-3.5-turbo",
-            messages=prompt,
-            provider="openai",
-        )
-        print(f"Response: {response_openai['response']}\n")
-    except Exception as e:
-        print(f"Error: {e}\n")
+    print(openai_result)
 
     # HuggingFace (if available)
     print("\n--- HuggingFace (Mistral) ---")
-    try:
-        response_hf = wrapper.chat(
-            model="mistralai/Mistral-7B-Instruct-v0.2",
-            messages=prompt,
-            provider="huggingface",
-        )
-        print(f"Response: {response_hf['response']}\n")
-    except Exception as e:
-        print(f"Error: {e}\n")
+    print(hf_result)
 
 
 def example_custom_parameters():
@@ -531,11 +537,13 @@ def example_streaming_conversation():
     print("User: Tell me a short story about AI")
     print("Assistant: ", end="", flush=True)
 
-    full_response = ""
+    parts = []
     for chunk in conv.stream_send("Tell me a short story about AI"):
         print(chunk, end="", flush=True)
-        full_response += chunk
+        parts.append(chunk)
+    full_response = "".join(parts)
     print("\n")
+    print(f"(Received {len(full_response)} characters)\n")
 
 
 def example_model_info():
@@ -572,22 +580,16 @@ def example_advanced_message_formatting():
 
     # Complex conversation with context
     messages = [
-        {
-            "role": "system",
-            "content": "You are a helpful coding assistant. You provide clear, well-documented code examples."
-        },
-        {
-            "role": "user",
-            "content": "I need to parse a CSV file in Python."
-        },
-        {
-            "role": "assistant",
-            "content": "You can use the pandas library. Here's an example:\n```python\nimport pandas as pd\ndf = pd.read_csv('file.csv')\n```"
-        },
-        {
-            "role": "user",
-            "content": "What if I want to handle missing values?"
-        },
+        _msg(
+            ROLE_SYSTEM,
+            "You are a helpful coding assistant. You provide clear, well-documented code examples.",
+        ),
+        _msg(ROLE_USER, "I need to parse a CSV file in Python."),
+        _msg(
+            ROLE_ASSISTANT,
+            "You can use the pandas library. Here's an example:\n```python\nimport pandas as pd\ndf = pd.read_csv('file.csv')\n```",
+        ),
+        _msg(ROLE_USER, "What if I want to handle missing values?"),
     ]
 
     response = wrapper.chat(
@@ -625,6 +627,8 @@ def example_models_registry_info():
         print("Models registry not available.\n")
         return
 
+    from models.models_registry import get_model_info
+
     model_id = "gpt-3.5-turbo"
     model_info = get_model_info(model_id)
 
@@ -657,6 +661,8 @@ def example_models_registry_search():
         print("Models registry not available.\n")
         return
 
+    from models.models_registry import search_models
+
     query = "instruction"
     results = search_models(query)
 
@@ -677,6 +683,8 @@ def example_models_registry_free_tier():
         print("Models registry not available.\n")
         return
 
+    from models.models_registry import get_free_models
+
     free_models = get_free_models()
     print(f"\nFound {len(free_models)} models with free tier:\n")
     for model in free_models[:5]:
@@ -697,6 +705,8 @@ def example_models_registry_local():
         print("Models registry not available.\n")
         return
 
+    from models.models_registry import get_local_models
+
     local_models = get_local_models()
     print(f"\nFound {len(local_models)} models that can run locally:\n")
     for model in local_models[:5]:
@@ -719,6 +729,13 @@ def example_models_registry_comparison():
         print("Models registry not available.\n")
         return
 
+    from models.models_registry import (
+        ALL_MODELS,
+        ModelType,
+        list_models_by_provider,
+        list_models_by_type,
+    )
+
     hf_models = list_models_by_provider("huggingface")
     openai_models = list_models_by_provider("openai")
     chat_models = list_models_by_type(ModelType.CHAT)
@@ -744,6 +761,8 @@ def example_models_registry_integration():
         print("Models registry not available.\n")
         return
 
+    from models.models_registry import get_model_info
+
     # Get model info from registry
     model_id = "gpt-3.5-turbo"
     model_info = get_model_info(model_id)
@@ -788,11 +807,6 @@ if __name__ == "__main__":
         example_model_info,
         example_advanced_message_formatting,
         example_all_starter_prompts,
-        example_models_registry_info,
-        example_models_registry_search,
-        example_models_registry_free_tier,
-        example_models_registry_local,
-        example_models_registry_comparison,
     ]
 
     # Optional examples (require additional setup)
@@ -805,9 +819,21 @@ if __name__ == "__main__":
         example_provider_comparison,  # Requires both API keys
         example_dataset_loading,  # Requires dataset_loaders module
         example_dataset_conversion,  # Requires dataset_loaders module
-        example_models_registry_integration,  # Requires models registry and API keys
     ]
 
+    # Registry examples are only scheduled when the models package is importable
+    if MODELS_REGISTRY_AVAILABLE:
+        basic_examples.extend([
+            example_models_registry_info,
+            example_models_registry_search,
+            example_models_registry_free_tier,
+            example_models_registry_local,
+            example_models_registry_comparison,
+        ])
+        optional_examples.append(
+            example_models_registry_integration  # Requires API keys
+        )
+
     print("\n" + "=" * 70)
     print("CHATBOT API WRAPPER - COMPREHENSIVE EXAMPLES")
     print("=" * 70 + "\n")
@@ -3,35 +3,158 @@ Health check utilities for monitoring system status
 Includes dependency checks and HTTP endpoint support
 """
 
+import functools
+import threading
 import time
-import importlib
+import importlib.util
 from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
 
 from .logger import get_logger
 from .metrics import get_metrics_collector
 
 logger = get_logger("api_wrapper.health")
 
+_REQUIRED_MODULES = ("requests", "openai", "transformers", "torch")
+_OPTIONAL_MODULES = ("pydantic", "tenacity", "cachetools", "structlog", "httpx")
+
+
+@functools.lru_cache(maxsize=None)
+def _module_available(name: str) -> bool:
+    """
+    Check whether a module is installed without importing it
+
+    find_spec only locates the module on sys.path, so probing torch or
+    transformers does not execute them.
+    """
+    return importlib.util.find_spec(name) is not None
+
+
+# (epoch second, formatted UTC timestamp) for the most recent _iso_now() call
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+
+def _iso_now() -> str:
+    """Current UTC time as ISO-8601, formatted at most once per second"""
+    global _timestamp_cache
+    now = int(time.time())
+    cached = _timestamp_cache
+    if cached[0] != now:
+        cached = (now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)))
+        _timestamp_cache = cached
+    return cached[1]
+
 
 class HealthChecker:
     """Health check manager with dependency checks"""
 
-    def __init__(self):
+    def __init__(self, health_ttl: float = 2.0, background_refresh: bool = False):
+        """
+        Initialize health checker
+
+        Args:
+            health_ttl: Seconds a check_health() result is reused before recomputing
+            background_refresh: Recompute the health snapshot every health_ttl
+                seconds on a daemon thread, so check_health() never aggregates
+                metrics on the caller's thread
+        """
         self.logger = get_logger("api_wrapper.health")
-        self.start_time = time.time()
+        self.start_time = time.monotonic()  # monotonic: immune to wall-clock jumps
         self.last_check: Optional[float] = None
+        # Filled in on the first check_dependencies() call
         self.dependencies: Dict[str, bool] = {}
-        self._check_dependencies()
+        self._dependencies_checked = False
+        # (computed_at, result, http_status_code) from the last health computation
+        self.health_ttl = health_ttl
+        self._health_cache: Optional[Tuple[float, Dict[str, Any], int]] = None
+        self._health_lock = threading.Lock()
+        self._refresh_stop = threading.Event()
+        self._refresh_thread: Optional[threading.Thread] = None
+        if background_refresh:
+            self.start_background_refresh()
 
     def check_health(self) -> Dict[str, Any]:
         """
         Perform health check
 
+        Results are cached for health_ttl seconds so frequent probes share
+        one metrics aggregation; uptime and timestamp are current on every call.
+
         Returns:
             Health status dictionary
         """
-        self.last_check = time.time()
+        return self._health_snapshot()[0]
+
+    def _health_snapshot(self) -> Tuple[Dict[str, Any], int]:
+        """Return the current (health status dict, HTTP status code) pair"""
+        cached = self._health_cache
+        # The background refresher keeps the snapshot current on its own
+        if cached is None or (
+            self._refresh_thread is None and time.monotonic() - cached[0] >= self.health_ttl
+        ):
+            with self._health_lock:
+                # Another thread may have refreshed the cache while we waited
+                cached = self._health_cache
+                if cached is None or time.monotonic() - cached[0] >= self.health_ttl:
+                    cached = self._store_health(self._compute_health())
+        return self._stamp(cached[1]), cached[2]
+
+    def _stamp(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy a cached health result with the uptime and timestamp of this read"""
+        return {
+            **result,
+            "uptime_seconds": time.monotonic() - self.start_time,
+            "timestamp": _iso_now(),
+            "metrics": dict(result["metrics"]),
+            "provider_availability": {
+                provider: dict(availability)
+                for provider, availability in result["provider_availability"].items()
+            },
+            "issues": list(result["issues"]),
+        }
+
+    def start_background_refresh(self):
+        """Start the daemon thread that recomputes the health snapshot"""
+        if self._refresh_thread is not None:
+            return
+        self._refresh_stop.clear()
+        self._refresh_health()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop, name="health-refresh", daemon=True
+        )
+        self._refresh_thread.start()
+
+    def stop_background_refresh(self):
+        """Stop the background refresher; check_health() falls back to the TTL cache"""
+        thread = self._refresh_thread
+        if thread is None:
+            return
+        self._refresh_stop.set()
+        thread.join()
+        self._refresh_thread = None
+
+    def _refresh_loop(self):
+        """Recompute the health snapshot every health_ttl seconds until stopped"""
+        while not self._refresh_stop.wait(self.health_ttl):
+            try:
+                self._refresh_health()
+            except Exception as e:
+                self.logger.warning(f"Background health refresh failed: {e}")
+
+    def _refresh_health(self):
+        """Recompute and store the health snapshot"""
+        with self._health_lock:
+            self._store_health(self._compute_health())
+
+    def _store_health(self, result: Dict[str, Any]) -> Tuple[float, Dict[str, Any], int]:
+        """Cache a freshly computed health result with its HTTP status code"""
+        status_code = 503 if result["status"] == "unhealthy" else 200
+        cached = (time.monotonic(), result, status_code)
+        self._health_cache = cached
+        return cached
+
+    def _compute_health(self) -> Dict[str, Any]:
+        """Aggregate metrics into a fresh health status dictionary"""
+        self.last_check = time.monotonic()
         uptime = self.last_check - self.start_time
 
         # Get metrics
@@ -50,22 +173,21 @@ class HealthChecker:
                 issues.append(f"{provider} availability is {avail_pct:.1f}%")
 
         # Check error rates
-        total_requests = sum(stats.get("request_counts", {}).values())
-        total_errors = sum(stats.get("error_counts", {}).values())
-        if total_requests > 0:
-            error_rate = (total_errors / total_requests) * 100
-            if error_rate > 10.0:
-                health_status = "unhealthy"
-                issues.append(f"Error rate is {error_rate:.1f}%")
+        total_requests = stats["total_requests"]
+        total_errors = stats["total_errors"]
+        error_rate = stats["error_rate_percent"]
+        if error_rate > 10.0:
+            health_status = "unhealthy"
+            issues.append(f"Error rate is {error_rate:.1f}%")
 
         return {
             "status": health_status,
             "uptime_seconds": uptime,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
             "metrics": {
                 "total_requests": total_requests,
                 "total_errors": total_errors,
-                "error_rate_percent": (total_errors / total_requests * 100) if total_requests > 0 else 0.0,
+                "error_rate_percent": error_rate,
             },
             "provider_availability": stats.get("provider_availability", {}),
             "issues": issues,
@@ -80,7 +202,7 @@ class HealthChecker:
         """
         return {
             "ready": True,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
 
     def check_liveness(self) -> Dict[str, Any]:
@@ -92,41 +214,20 @@ class HealthChecker:
         """
         return {
             "alive": True,
-            "uptime_seconds": time.time() - self.start_time,
-            "timestamp": datetime.utcnow().isoformat(),
+            "uptime_seconds": time.monotonic() - self.start_time,
+            "timestamp": _iso_now(),
         }
 
     def _check_dependencies(self):
         """Check availability of required dependencies"""
-        required_modules = [
-            "requests",
-            "openai",
-            "transformers",
-            "torch",
-        ]
-
-        optional_modules = [
-            "pydantic",
-            "tenacity",
-            "cachetools",
-            "structlog",
-            "httpx",
-        ]
+        for module in _REQUIRED_MODULES + _OPTIONAL_MODULES:
+            self.dependencies[module] = _module_available(module)
 
-        for module in required_modules:
-            try:
-                importlib.import_module(module)
-                self.dependencies[module] = True
-            except ImportError:
-                self.dependencies[module] = False
+        for module in _REQUIRED_MODULES:
+            if not self.dependencies[module]:
                 self.logger.warning(f"Required dependency {module} not available")
 
-        for module in optional_modules:
-            try:
-                importlib.import_module(module)
-                self.dependencies[module] = True
-            except ImportError:
-                self.dependencies[module] = False
+        self._dependencies_checked = True
 
     def check_dependencies(self) -> Dict[str, Any]:
         """
@@ -135,16 +236,18 @@ class HealthChecker:
         Returns:
             Dependency status dictionary
         """
+        if not self._dependencies_checked:
+            self._check_dependencies()
+
         missing_required = [
-            name for name, available in self.dependencies.items()
-            if not available and name in ["requests", "openai", "transformers", "torch"]
+            name for name in _REQUIRED_MODULES if not self.dependencies[name]
         ]
 
         return {
             "dependencies": self.dependencies,
             "all_required_available": len(missing_required) == 0,
             "missing_required": missing_required,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _iso_now(),
         }
 
     def get_http_response(self, endpoint: str = "health") -> Tuple[Dict[str, Any], int]:
@@ -158,11 +261,7 @@ class HealthChecker:
             Tuple of (response_dict, status_code)
         """
         if endpoint == "health":
-            health_data = self.check_health()
-            status_code = 200 if health_data["status"] == "healthy" else (
-                503 if health_data["status"] == "unhealthy" else 200
-            )
-            return health_data, status_code
+            return self._health_snapshot()
         elif endpoint == "readiness":
             readiness_data = self.check_readiness()
             status_code = 200 if readiness_data["ready"] else 503
@@ -177,11 +276,17 @@ class HealthChecker:
 
 # Global health checker
 _health_checker: Optional[HealthChecker] = None
+_health_checker_lock = threading.Lock()
 
 
 def get_health_checker() -> HealthChecker:
-    """Get or create health checker instance"""
+    """Get or create the shared health checker instance"""
     global _health_checker
-    if _health_checker is None:
-        _health_checker = HealthChecker()
-    return _health_checker
+    # Double-checked so concurrent first callers share one instance
+    instance = _health_checker
+    if instance is None:
+        with _health_checker_lock:
+            if _health_checker is None:
+                _health_checker = HealthChecker()
+            instance = _health_checker
+    return instance
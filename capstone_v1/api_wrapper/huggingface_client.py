@@ -3,14 +3,18 @@ HuggingFace API Client for chatbot interactions
 Supports both Inference API and local model loading
 """
 
+import asyncio
+import functools
+import importlib.util
+import threading
 import requests
-from typing import Dict, List, Optional, Union, Any
-from transformers import AutoTokenizer, AutoModelForCausalLM
-import torch
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
+from requests.adapters import HTTPAdapter
 
 from .config import (
     HUGGINGFACE_API_KEY,
     HUGGINGFACE_API_URL,
+    HUGGINGFACE_CHATBOT_MODELS,
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
     DEFAULT_TOP_P,
@@ -19,6 +23,7 @@ from .config import (
 from .logger import get_logger
 from .exceptions import (
     APIError,
+    ConfigurationError,
     RateLimitError,
     AuthenticationError,
     ModelNotFoundError,
@@ -26,17 +31,104 @@ from .exceptions import (
     TimeoutError,
 )
 
+# orjson decodes response bytes directly and is noticeably faster on long
+# generations; fall back to the stdlib when it is not installed
+_json_loads: Callable[[Union[bytes, str]], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+
+    def _stdlib_json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+
+def _rate_limit_error(status_code: int, headers: Any, model_id: str) -> APIError:
+    return RateLimitError(
+        "HuggingFace API rate limit exceeded",
+        retry_after=int(headers.get("Retry-After", 60)),
+        details={"model": model_id, "status_code": status_code}
+    )
+
+
+def _authentication_error(status_code: int, headers: Any, model_id: str) -> APIError:
+    return AuthenticationError(
+        "Invalid HuggingFace API key",
+        details={"model": model_id, "status_code": status_code}
+    )
+
+
+def _model_not_found_error(status_code: int, headers: Any, model_id: str) -> APIError:
+    return ModelNotFoundError(model_id, details={"status_code": status_code})
+
+
+def _generic_api_error(status_code: int, headers: Any, model_id: str) -> APIError:
+    return APIError(
+        f"HuggingFace API request failed with HTTP {status_code}",
+        details={"model": model_id, "status_code": status_code}
+    )
+
+
+# Exception factories for error responses; anything unlisted is a generic APIError
+_STATUS_HANDLERS: Dict[int, Callable[[int, Any, str], APIError]] = {
+    429: _rate_limit_error,
+    401: _authentication_error,
+    404: _model_not_found_error,
+}
+
+
+def _api_status_error(status_code: int, headers: Any, model_id: str) -> APIError:
+    """Build the wrapper exception for an HTTP error response (status >= 400)"""
+    handler = _STATUS_HANDLERS.get(status_code, _generic_api_error)
+    return handler(status_code, headers, model_id)
+
+
+# Supported values for HuggingFaceClient(quantization=...)
+_QUANTIZATION_MODES = (None, "int8", "nf4")
+
+# Supported values for HuggingFaceClient(backend=...)
+_LOCAL_BACKENDS = ("transformers", "vllm", "tgi")
+
+# Prompt prefixes for the plain-text chat format; other roles are dropped
+_ROLE_PREFIX = {
+    "system": "System: ",
+    "user": "User: ",
+    "assistant": "Assistant: ",
+}
+
 
 class HuggingFaceClient:
     """
     Client for interacting with HuggingFace models via Inference API or locally
     """
 
+    # Locally loaded (model, tokenizer) pairs shared by all clients, keyed by
+    # (model_id, device, precision, compiled); vLLM engines are stored as
+    # (engine, generate lock) under device "vllm"
+    _MODEL_REGISTRY: Dict[Tuple[str, str, str, bool], Tuple[Any, Any]] = {}
+    # One lock per registry key, so loading one model does not block clients
+    # that want a different (or an already loaded) model; _REGISTRY_LOCK only
+    # guards creating those locks
+    _LOAD_LOCKS: Dict[Tuple[str, str, str, bool], threading.Lock] = {}
+    _REGISTRY_LOCK = threading.Lock()
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         use_local: bool = False,
         device: str = "auto",
+        quantization: Optional[str] = None,
+        compile_model: bool = False,
+        backend: str = "transformers",
+        tgi_url: str = "http://localhost:8080",
+        tgi_token: Optional[str] = None,
     ):
         """
         Initialize HuggingFace client
@@ -45,32 +137,90 @@ class HuggingFaceClient:
             api_key: HuggingFace API key (if None, uses HUGGINGFACE_API_KEY env var)
             use_local: If True, load models locally instead of using Inference API
             device: Device to use for local models ('cpu', 'cuda', 'auto')
+            quantization: Load local weights quantized on CUDA ('int8', 'nf4', or None).
+                Requires bitsandbytes; ignored with a warning when it is unavailable.
+            compile_model: Wrap local CUDA models with torch.compile to cut per-step
+                Python overhead; 'reduce-overhead' mode also replays decode steps
+                as CUDA graphs over a static KV cache (first generation is slower
+                while compiling)
+            backend: Local inference backend: 'transformers' (in-process generate),
+                'vllm' (in-process vLLM engine shared by all clients; calls are
+                serialized) or 'tgi' (a running text-generation-inference server at tgi_url)
+            tgi_url: Base URL of the TGI server when backend='tgi'
+            tgi_token: Bearer token for the TGI server; the HuggingFace API key
+                is never sent to tgi_url
         """
+        if quantization not in _QUANTIZATION_MODES:
+            raise ConfigurationError(
+                f"Unsupported quantization '{quantization}'. "
+                f"Use one of: {', '.join(m for m in _QUANTIZATION_MODES if m)}"
+            )
+        if backend not in _LOCAL_BACKENDS:
+            raise ConfigurationError(
+                f"Unsupported backend '{backend}'. Use one of: {', '.join(_LOCAL_BACKENDS)}"
+            )
         self.logger = get_logger("api_wrapper.huggingface_client")
         self.api_key = api_key or HUGGINGFACE_API_KEY
         self.use_local = use_local
-        self.device = device
+        self._device_pref = device
+        self._device: Optional[str] = None
+        self.quantization = quantization
+        self._quantization_warned = False
+        self.compile_model = compile_model
+        self.backend = backend
+        self.tgi_url = tgi_url.rstrip("/")
         self.base_url = HUGGINGFACE_API_URL
         self.local_models: Dict[str, Any] = {}
         self.local_tokenizers: Dict[str, Any] = {}
 
+        # Request headers only depend on the API key, so build them once
+        self._headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if self.api_key:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+        self._tgi_headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if tgi_token:
+            self._tgi_headers["Authorization"] = f"Bearer {tgi_token}"
+
+        # Created lazily by _get_async_client for achat, together with the
+        # event loop it belongs to
+        self._aclient: Any = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Keep-alive session so Inference API calls reuse pooled connections.
+        # No transport-level retries: ChatbotWrapper's RetryHandler owns
+        # retrying, and stacking both would multiply the attempts
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0),
+        )
+
         if self.use_local:
-            # Determine device
-            if device == "auto":
-                self.device = "cuda" if torch.cuda.is_available() else "cpu"
-            else:
-                self.device = device
             self.logger.info(f"Using local models with device: {self.device}")
         else:
             if not self.api_key:
                 self.logger.warning("No HuggingFace API key provided. Some features may not work.")
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests"""
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
+    @property
+    def device(self) -> str:
+        """
+        Device for local models, resolved on first access
+
+        'auto' is resolved by importing torch here rather than at module import,
+        so API-only clients never pay for loading torch or probing CUDA.
+        """
+        if self._device is None:
+            if self._device_pref == "auto":
+                import torch
+                self._device = "cuda" if torch.cuda.is_available() else "cpu"
+            else:
+                self._device = self._device_pref
+        return self._device
+
+    @device.setter
+    def device(self, value: str):
+        self._device_pref = value
+        self._device = None
 
     def _load_model_locally(self, model_id: str) -> tuple:
         """
@@ -85,20 +235,72 @@ class HuggingFaceClient:
         if model_id in self.local_models:
             return self.local_models[model_id], self.local_tokenizers[model_id]
 
+        # Weights are shared process-wide, so a second client with the same
+        # settings reuses the already loaded model instead of loading it again
+        precision = self.quantization or ("float16" if self.device == "cuda" else "float32")
+        key = (model_id, self.device, precision, self.compile_model)
+        model, tokenizer = self._get_or_load(key, lambda: self._load_model_from_hub(model_id))
+        self.local_tokenizers[model_id] = tokenizer
+        self.local_models[model_id] = model
+        return model, tokenizer
+
+    @staticmethod
+    def _get_or_load(
+        key: Tuple[str, str, str, bool], load: Callable[[], Tuple[Any, Any]]
+    ) -> Tuple[Any, Any]:
+        """Return the registry entry for key, calling load() once if it is missing"""
+        loaded = HuggingFaceClient._MODEL_REGISTRY.get(key)
+        if loaded is not None:
+            return loaded
+        with HuggingFaceClient._REGISTRY_LOCK:
+            load_lock = HuggingFaceClient._LOAD_LOCKS.setdefault(key, threading.Lock())
+        with load_lock:
+            # Another client may have finished loading while we waited
+            loaded = HuggingFaceClient._MODEL_REGISTRY.get(key)
+            if loaded is None:
+                loaded = load()
+                HuggingFaceClient._MODEL_REGISTRY[key] = loaded
+        return loaded
+
+    def _load_model_from_hub(self, model_id: str) -> Tuple[Any, Any]:
+        """Load a model and tokenizer with this client's device and precision settings"""
+        # Heavy ML dependencies are only needed for local inference
+        import torch
+        from transformers import AutoTokenizer, AutoModelForCausalLM
+
         self.logger.info(f"Loading model {model_id} locally...")
         try:
             tokenizer = AutoTokenizer.from_pretrained(model_id)
-            model = AutoModelForCausalLM.from_pretrained(
-                model_id,
-                torch_dtype=torch.float16 if self.device == "cuda" else torch.float32,
-                device_map="auto" if self.device == "cuda" else None,
-            )
+            load_kwargs: Dict[str, Any] = {
+                "attn_implementation": self._get_attn_implementation(),
+            }
+            quantization_config = self._get_quantization_config()
+            if quantization_config is not None:
+                load_kwargs["quantization_config"] = quantization_config
+            dtype = torch.float16 if self.device == "cuda" else torch.float32
+            device_map = "auto" if self.device == "cuda" else None
+            try:
+                model = AutoModelForCausalLM.from_pretrained(
+                    model_id, torch_dtype=dtype, device_map=device_map, **load_kwargs
+                )
+            except (TypeError, ValueError) as e:
+                # Older transformers or architectures without SDPA/FlashAttention support
+                self.logger.debug(f"Retrying {model_id} with default attention: {e}")
+                load_kwargs.pop("attn_implementation")
+                model = AutoModelForCausalLM.from_pretrained(
+                    model_id, torch_dtype=dtype, device_map=device_map, **load_kwargs
+                )
 
             if self.device == "cpu":
                 model = model.to(self.device)
+            elif self.compile_model and quantization_config is None:
+                # CUDA graphs need fixed shapes; with the default dynamic KV
+                # cache every new sequence length would recompile and re-record
+                model.generation_config.cache_implementation = "static"
+                model.forward = torch.compile(
+                    model.forward, mode="reduce-overhead", fullgraph=False
+                )
 
-            self.local_tokenizers[model_id] = tokenizer
-            self.local_models[model_id] = model
             self.logger.info(f"Successfully loaded model {model_id}")
             return model, tokenizer
         except Exception as e:
@@ -109,6 +311,50 @@ class HuggingFaceClient:
                 details={"error": str(e), "device": self.device}
             )
 
+    def _get_attn_implementation(self) -> str:
+        """
+        Pick the fused attention kernel for local models
+
+        FlashAttention-2 needs CUDA on Ampere or newer plus the flash_attn
+        package; everything else uses PyTorch's scaled_dot_product_attention.
+        """
+        if self.device == "cuda" and importlib.util.find_spec("flash_attn") is not None:
+            import torch
+
+            major, _ = torch.cuda.get_device_capability()
+            if major >= 8:
+                return "flash_attention_2"
+        return "sdpa"
+
+    def _get_quantization_config(self) -> Optional[Any]:
+        """
+        Build a BitsAndBytesConfig for the configured quantization mode
+
+        Returns None (full-precision load) when quantization is off, the device
+        is not CUDA, or bitsandbytes is not installed.
+        """
+        if self.quantization is None or self.device != "cuda":
+            return None
+
+        if importlib.util.find_spec("bitsandbytes") is None:
+            if not self._quantization_warned:
+                self.logger.warning(
+                    f"bitsandbytes is not installed; loading models without {self.quantization} quantization"
+                )
+                self._quantization_warned = True
+            return None
+
+        import torch
+        from transformers import BitsAndBytesConfig
+
+        if self.quantization == "int8":
+            return BitsAndBytesConfig(load_in_8bit=True)
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_compute_dtype=torch.float16,
+            bnb_4bit_quant_type="nf4",
+        )
+
     def chat(
         self,
         model_id: str,
@@ -135,6 +381,14 @@ class HuggingFaceClient:
             Dictionary with 'response' and metadata
         """
         if self.use_local:
+            if self.backend == "vllm":
+                return self._chat_vllm(
+                    model_id, messages, temperature, max_tokens, top_p, top_k, **kwargs
+                )
+            if self.backend == "tgi":
+                return self._chat_tgi(
+                    model_id, messages, temperature, max_tokens, top_p, top_k, **kwargs
+                )
             return self._chat_local(
                 model_id, messages, temperature, max_tokens, top_p, top_k, **kwargs
             )
@@ -143,9 +397,8 @@ class HuggingFaceClient:
                 model_id, messages, temperature, max_tokens, top_p, top_k, **kwargs
             )
 
-    def _chat_api(
+    def _build_api_payload(
         self,
-        model_id: str,
         messages: Union[str, List[Dict[str, str]]],
         temperature: float,
         max_tokens: int,
@@ -153,9 +406,7 @@ class HuggingFaceClient:
         top_k: int,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Generate response using HuggingFace Inference API"""
-        url = f"{self.base_url}/{model_id}"
-
+        """Build the Inference API request payload"""
         # Format messages
         if isinstance(messages, str):
             prompt = messages
@@ -163,8 +414,7 @@ class HuggingFaceClient:
             # Convert message list to prompt
             prompt = self._format_messages(messages)
 
-        # Prepare request payload
-        payload = {
+        return {
             "inputs": prompt,
             "parameters": {
                 "temperature": temperature,
@@ -176,54 +426,58 @@ class HuggingFaceClient:
             },
         }
 
+    def _parse_api_result(self, content: bytes, model_id: str) -> Dict[str, Any]:
+        """Extract the generated text from an Inference API response body"""
         try:
-            self.logger.debug(f"Sending request to HuggingFace API: {model_id}")
-            response = requests.post(
-                url, headers=self._get_headers(), json=payload, timeout=120
+            result = _json_loads(content)
+        except ValueError as e:
+            raise APIError(
+                f"HuggingFace API returned invalid JSON: {str(e)}",
+                details={"model": model_id}
             )
 
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
-                raise RateLimitError(
-                    "HuggingFace API rate limit exceeded",
-                    retry_after=retry_after,
-                    details={"model": model_id, "status_code": 429}
-                )
-
-            # Handle authentication errors
-            if response.status_code == 401:
-                raise AuthenticationError(
-                    "Invalid HuggingFace API key",
-                    details={"model": model_id, "status_code": 401}
-                )
+        # Handle different response formats
+        if isinstance(result, list) and len(result) > 0:
+            generated_text = result[0].get("generated_text", "")
+        elif isinstance(result, dict):
+            generated_text = result.get("generated_text", "")
+        else:
+            generated_text = str(result)
 
-            # Handle model not found
-            if response.status_code == 404:
-                raise ModelNotFoundError(
-                    model_id,
-                    details={"status_code": 404}
-                )
+        self.logger.debug(f"Successfully received response from {model_id}")
+        return {
+            "response": generated_text.strip(),
+            "model": model_id,
+            "provider": "huggingface",
+            "method": "api",
+        }
 
-            response.raise_for_status()
+    def _chat_api(
+        self,
+        model_id: str,
+        messages: Union[str, List[Dict[str, str]]],
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+        top_k: int,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Generate response using HuggingFace Inference API"""
+        url = f"{self.base_url}/{model_id}"
+        payload = self._build_api_payload(
+            messages, temperature, max_tokens, top_p, top_k, **kwargs
+        )
 
-            result = response.json()
+        try:
+            self.logger.debug(f"Sending request to HuggingFace API: {model_id}")
+            response = self._session.post(
+                url, headers=self._headers, data=_json_dumps(payload), timeout=120
+            )
 
-            # Handle different response formats
-            if isinstance(result, list) and len(result) > 0:
-                generated_text = result[0].get("generated_text", "")
-            elif isinstance(result, dict):
-                generated_text = result.get("generated_text", "")
-            else:
-                generated_text = str(result)
+            if response.status_code >= 400:
+                raise _api_status_error(response.status_code, response.headers, model_id)
 
-            self.logger.debug(f"Successfully received response from {model_id}")
-            return {
-                "response": generated_text.strip(),
-                "model": model_id,
-                "provider": "huggingface",
-                "method": "api",
-            }
+            return self._parse_api_result(response.content, model_id)
         except requests.exceptions.Timeout as e:
             raise TimeoutError(
                 "HuggingFace API request timeout",
@@ -247,6 +501,121 @@ class HuggingFaceClient:
                 details={"model": model_id, "status_code": getattr(e.response, 'status_code', None)}
             )
 
+    async def _get_async_client(self) -> Tuple[Any, Any]:
+        """
+        Return the (httpx.AsyncClient, httpx module) pair for the running loop
+
+        Pooled connections are bound to the loop that opened them, so a new
+        client is created when achat runs on a different loop (e.g. a later
+        asyncio.run call) and the previous client is closed.
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ConfigurationError(
+                "Async chat requires httpx. Install it with: pip install httpx"
+            )
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            stale, stale_loop = self._aclient, self._aclient_loop
+            try:
+                # HTTP/2 lets concurrent requests share one connection (needs the h2 extra)
+                self._aclient = httpx.AsyncClient(http2=True, timeout=120, headers=self._headers)
+            except ImportError:
+                self._aclient = httpx.AsyncClient(timeout=120, headers=self._headers)
+            self._aclient_loop = loop
+            if stale is not None:
+                await self._close_stale_client(stale, stale_loop)
+        return self._aclient, httpx
+
+    async def _close_stale_client(self, client: Any, loop: Optional[asyncio.AbstractEventLoop]):
+        """Close a client created on an earlier event loop"""
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            # The old loop still runs in another thread; close the client there
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            await client.aclose()
+        except Exception as e:
+            # Once its loop is closed the client's sockets can no longer be
+            # shut down cleanly; the client itself is still marked closed
+            self.logger.debug(f"Closing stale HuggingFace async client failed: {e}")
+
+    async def achat(
+        self,
+        model_id: str,
+        messages: Union[str, List[Dict[str, str]]],
+        temperature: float = DEFAULT_TEMPERATURE,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        top_p: float = DEFAULT_TOP_P,
+        top_k: int = DEFAULT_TOP_K,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of chat, suitable for asyncio.gather over many prompts
+
+        API requests go through a shared httpx.AsyncClient; local models run
+        in the default executor so the event loop is not blocked.
+
+        Returns:
+            Dictionary with 'response' and metadata
+        """
+        if self.use_local:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None,
+                functools.partial(
+                    self.chat,
+                    model_id, messages, temperature, max_tokens, top_p, top_k, **kwargs
+                ),
+            )
+        return await self._chat_api_async(
+            model_id, messages, temperature, max_tokens, top_p, top_k, **kwargs
+        )
+
+    async def _chat_api_async(
+        self,
+        model_id: str,
+        messages: Union[str, List[Dict[str, str]]],
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+        top_k: int,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Generate response using HuggingFace Inference API without blocking"""
+        client, httpx = await self._get_async_client()
+
+        url = f"{self.base_url}/{model_id}"
+        payload = self._build_api_payload(
+            messages, temperature, max_tokens, top_p, top_k, **kwargs
+        )
+
+        try:
+            self.logger.debug(f"Sending async request to HuggingFace API: {model_id}")
+            response = await client.post(url, content=_json_dumps(payload))
+
+            if response.status_code >= 400:
+                raise _api_status_error(response.status_code, response.headers, model_id)
+
+            return self._parse_api_result(response.content, model_id)
+        except httpx.TimeoutException as e:
+            raise TimeoutError(
+                "HuggingFace API request timeout",
+                timeout=120,
+                details={"model": model_id, "error": str(e)}
+            )
+        except httpx.TransportError as e:
+            raise NetworkError(
+                f"Network error connecting to HuggingFace API: {str(e)}",
+                details={"model": model_id, "error": str(e)}
+            )
+        except httpx.HTTPError as e:
+            raise APIError(
+                f"HuggingFace API request failed: {str(e)}",
+                details={"model": model_id, "error": str(e)}
+            )
+
     def _chat_local(
         self,
         model_id: str,
@@ -258,19 +627,17 @@ class HuggingFaceClient:
         **kwargs,
     ) -> Dict[str, Any]:
         """Generate response using locally loaded model"""
+        import torch
+
         model, tokenizer = self._load_model_locally(model_id)
 
-        # Format messages
-        if isinstance(messages, str):
-            prompt = messages
-        else:
-            prompt = self._format_messages(messages)
+        prompt, templated = self._build_local_prompt(tokenizer, messages)
 
         # Tokenize input
-        inputs = tokenizer(prompt, return_tensors="pt").to(self.device)
+        inputs = self._tokenize_local(tokenizer, prompt, templated)
 
         # Generate response
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = model.generate(
                 **inputs,
                 max_new_tokens=max_tokens,
@@ -282,14 +649,11 @@ class HuggingFaceClient:
                 **kwargs,
             )
 
-        # Decode response
-        generated_text = tokenizer.decode(outputs[0], skip_special_tokens=True)
-
-        # Remove prompt from response
-        if prompt in generated_text:
-            response_text = generated_text[len(prompt) :].strip()
-        else:
-            response_text = generated_text.strip()
+        # Decode only the continuation; the prompt tokens are sliced off
+        input_len = inputs["input_ids"].shape[1]
+        response_text = tokenizer.decode(
+            outputs[0, input_len:], skip_special_tokens=True
+        ).strip()
 
         return {
             "response": response_text,
@@ -298,29 +662,195 @@ class HuggingFaceClient:
             "method": "local",
         }
 
+    def _get_vllm_engine(self, model_id: str) -> Tuple[Any, threading.Lock]:
+        """Return the process-wide vLLM engine for a model and its generate lock"""
+        quantization = self._get_vllm_quantization()
+        key = (model_id, "vllm", quantization or "auto", False)
+        return self._get_or_load(
+            key, lambda: (self._start_vllm_engine(model_id, quantization), threading.Lock())
+        )
+
+    def _start_vllm_engine(self, model_id: str, quantization: Optional[str]) -> Any:
+        """Start a vLLM engine for the 'vllm' backend"""
+        try:
+            from vllm import LLM
+        except ImportError:
+            raise ConfigurationError(
+                "The 'vllm' backend requires vllm. Install it with: pip install vllm"
+            )
+        self.logger.info(f"Starting vLLM engine for {model_id}...")
+        try:
+            return LLM(model=model_id, quantization=quantization)
+        except Exception as e:
+            self.logger.error(f"Failed to start vLLM for {model_id}: {str(e)}", exc_info=True)
+            raise ModelNotFoundError(
+                model_id,
+                f"Failed to load model: {str(e)}",
+                details={"error": str(e), "backend": "vllm"}
+            )
+
+    def _get_vllm_quantization(self) -> Optional[str]:
+        """Map the client's quantization mode onto vLLM's naming"""
+        return "bitsandbytes" if self.quantization else None
+
+    def _chat_vllm(
+        self,
+        model_id: str,
+        messages: Union[str, List[Dict[str, str]]],
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+        top_k: int,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Generate response with the shared vLLM engine
+
+        The synchronous LLM class is not thread-safe, so concurrent calls are
+        serialized on the engine's lock; batch prompts into one call instead.
+        """
+        from vllm import SamplingParams
+
+        engine, generate_lock = self._get_vllm_engine(model_id)
+        tokenizer = engine.get_tokenizer()
+        prompt, templated = self._build_local_prompt(tokenizer, messages)
+        # A chat template already emits BOS, so hand vLLM the token ids
+        # rather than letting it add special tokens a second time
+        vllm_input: Any = (
+            {"prompt_token_ids": tokenizer.encode(prompt, add_special_tokens=False)}
+            if templated else prompt
+        )
+        params = SamplingParams(
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        with generate_lock:
+            outputs = engine.generate([vllm_input], params, use_tqdm=False)
+
+        return {
+            "response": outputs[0].outputs[0].text.strip(),
+            "model": model_id,
+            "provider": "huggingface",
+            "method": "vllm",
+        }
+
+    def _chat_tgi(
+        self,
+        model_id: str,
+        messages: Union[str, List[Dict[str, str]]],
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+        top_k: int,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Generate response from a text-generation-inference server"""
+        kwargs.setdefault("do_sample", True)
+        payload = self._build_api_payload(
+            messages, temperature, max_tokens, top_p, top_k, **kwargs
+        )
+
+        try:
+            self.logger.debug(f"Sending request to TGI server: {self.tgi_url}")
+            response = self._session.post(
+                f"{self.tgi_url}/generate",
+                headers=self._tgi_headers,
+                data=_json_dumps(payload),
+                timeout=120,
+            )
+
+            if response.status_code == 401:
+                raise AuthenticationError(
+                    f"TGI server at {self.tgi_url} rejected the request; check tgi_token",
+                    details={"model": model_id, "status_code": 401}
+                )
+            if response.status_code >= 400:
+                raise _api_status_error(response.status_code, response.headers, model_id)
+
+            result = self._parse_api_result(response.content, model_id)
+            result["method"] = "tgi"
+            return result
+        except requests.exceptions.Timeout as e:
+            raise TimeoutError(
+                "TGI request timeout",
+                timeout=120,
+                details={"model": model_id, "error": str(e)}
+            )
+        except requests.exceptions.ConnectionError as e:
+            raise NetworkError(
+                f"Network error connecting to TGI server at {self.tgi_url}: {str(e)}",
+                details={"model": model_id, "error": str(e)}
+            )
+        except requests.exceptions.RequestException as e:
+            raise APIError(
+                f"TGI request failed: {str(e)}",
+                details={"model": model_id, "status_code": getattr(e.response, 'status_code', None)}
+            )
+
+    def _tokenize_local(
+        self, tokenizer: Any, prompt: str, templated: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Tokenize a prompt and move it to the model device
+
+        Prompts rendered by a chat template already contain BOS and other
+        special tokens, so the tokenizer must not add them again. On CUDA the
+        tensors are staged in pinned memory so the host-to-device copy can
+        run asynchronously.
+        """
+        inputs = tokenizer(prompt, return_tensors="pt", add_special_tokens=not templated)
+        if self.device == "cuda":
+            return {
+                name: tensor.pin_memory().to(self.device, non_blocking=True)
+                for name, tensor in inputs.items()
+            }
+        on_device: Dict[str, Any] = inputs.to(self.device)
+        return on_device
+
+    def _build_local_prompt(
+        self, tokenizer: Any, messages: Union[str, List[Dict[str, str]]]
+    ) -> Tuple[str, bool]:
+        """
+        Build the prompt for a locally loaded model
+
+        Uses the tokenizer's own chat template when it has one, so each model
+        sees its native special tokens; otherwise falls back to _format_messages.
+
+        Returns:
+            Tuple of (prompt, templated) where templated is True when the
+            prompt came from the chat template and already holds special tokens
+        """
+        if isinstance(messages, str):
+            return messages, False
+        if getattr(tokenizer, "chat_template", None):
+            try:
+                prompt: str = tokenizer.apply_chat_template(
+                    messages, tokenize=False, add_generation_prompt=True
+                )
+                return prompt, True
+            except Exception as e:
+                self.logger.debug(f"Chat template failed, using plain format: {e}")
+        return self._format_messages(messages), False
+
     def _format_messages(self, messages: List[Dict[str, str]]) -> str:
         """
-        Format message list into a prompt string
-        Handles different chat template formats
+        Format message list into a plain-text prompt string
+        Used for the Inference API and for tokenizers without a chat template
         """
         if not messages:
             return ""
 
-        # Try to use tokenizer's chat template if available
-        # Otherwise, use simple formatting
-        formatted = ""
+        parts = []
         for msg in messages:
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            if role == "system":
-                formatted += f"System: {content}\n\n"
-            elif role == "user":
-                formatted += f"User: {content}\n\n"
-            elif role == "assistant":
-                formatted += f"Assistant: {content}\n\n"
-
-        formatted += "Assistant: "
-        return formatted
+            prefix = _ROLE_PREFIX.get(msg.get("role", "user"))
+            if prefix is not None:
+                parts.append(f"{prefix}{msg.get('content', '')}\n\n")
+
+        parts.append("Assistant: ")
+        return "".join(parts)
 
     def stream_chat(
         self,
@@ -334,38 +864,70 @@ class HuggingFaceClient:
         Stream chat responses (yields tokens as they're generated)
         Note: Streaming is primarily supported for local models
         """
-        if not self.use_local:
-            # For API, we can't easily stream, so return full response
+        if not self.use_local or self.backend != "transformers":
+            # For API and server backends, we can't easily stream, so return full response
             result = self.chat(model_id, messages, temperature, max_tokens, **kwargs)
             yield result["response"]
             return
 
-        model, tokenizer = self._load_model_locally(model_id)
+        import torch
+        from transformers import TextIteratorStreamer
 
-        if isinstance(messages, str):
-            prompt = messages
-        else:
-            prompt = self._format_messages(messages)
+        model, tokenizer = self._load_model_locally(model_id)
 
-        inputs = tokenizer(prompt, return_tensors="pt").to(self.device)
-
-        with torch.no_grad():
-            for output in model.generate(
-                **inputs,
-                max_new_tokens=max_tokens,
-                temperature=temperature,
-                do_sample=True,
-                pad_token_id=tokenizer.eos_token_id,
-                **kwargs,
-            ):
-                generated_text = tokenizer.decode(output, skip_special_tokens=True)
-                if prompt in generated_text:
-                    response_text = generated_text[len(prompt) :].strip()
-                else:
-                    response_text = generated_text.strip()
-                yield response_text
+        prompt, templated = self._build_local_prompt(tokenizer, messages)
+
+        inputs = self._tokenize_local(tokenizer, prompt, templated)
+
+        # generate() runs in a worker thread and pushes decoded text into the
+        # streamer as each token is produced
+        streamer = TextIteratorStreamer(
+            tokenizer, skip_prompt=True, skip_special_tokens=True
+        )
+        errors: List[BaseException] = []
+
+        def _generate():
+            try:
+                with torch.inference_mode():
+                    model.generate(
+                        **inputs,
+                        streamer=streamer,
+                        max_new_tokens=max_tokens,
+                        temperature=temperature,
+                        do_sample=True,
+                        pad_token_id=tokenizer.eos_token_id,
+                        **kwargs,
+                    )
+            except BaseException as e:
+                errors.append(e)
+                # Unblock the consumer loop below
+                streamer.end()
+
+        thread = threading.Thread(target=_generate, daemon=True)
+        thread.start()
+        for text in streamer:
+            if text:
+                yield text
+        thread.join()
+
+        if errors:
+            raise errors[0]
 
     def list_available_models(self) -> List[str]:
         """List available models (returns configured models)"""
-        from .config import HUGGINGFACE_CHATBOT_MODELS
         return list(HUGGINGFACE_CHATBOT_MODELS.keys())
+
+    def close(self):
+        """Close the underlying HTTP session and release pooled connections"""
+        self._session.close()
+
+    async def aclose(self):
+        """Close the async HTTP client used by achat, if it was created"""
+        if self._aclient is not None:
+            client, loop = self._aclient, self._aclient_loop
+            self._aclient = None
+            self._aclient_loop = None
+            if loop is asyncio.get_running_loop():
+                await client.aclose()
+            else:
+                await self._close_stale_client(client, loop)
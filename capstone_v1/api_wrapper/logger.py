@@ -2,21 +2,113 @@
 Structured logging system for the Chatbot API Wrapper
 """
 
+import atexit
+import copy
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 import json
-from typing import Optional, Dict, Any
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
-from datetime import datetime
 import os
 
 
+# orjson serializes the small per-record dicts several times faster than the
+# stdlib encoder; fall back to compact json.dumps when it is not installed.
+# OPT_NON_STR_KEYS matches json.dumps, which stringifies int/None/... keys
+# in extra fields instead of raising
+try:
+    import orjson
+
+    def _json_dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode("utf-8")
+except ImportError:
+    def _json_dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+# Per-thread (second, formatted) pair so records logged within the same
+# second reuse the strftime result
+_TS_CACHE = threading.local()
+
+
+def _format_timestamp(record: logging.LogRecord) -> str:
+    """Format ``record.created`` as an ISO-8601 UTC string with milliseconds"""
+    sec = int(record.created)
+    cached = getattr(_TS_CACHE, "value", None)
+    if cached is None or cached[0] != sec:
+        cached = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+        _TS_CACHE.value = cached
+    return "%s.%03dZ" % (cached[1], record.msecs)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+
+    The stock ``prepare`` formats the record on the calling thread and
+    strips ``exc_info``; records here never leave the process, so only the
+    message arguments are merged so later mutation of them cannot leak in.
+    The copy is tagged with the name of the configured logger that queued
+    it, which selects the sinks the listener writes it to.
+    """
+
+    def __init__(self, log_queue: "queue.SimpleQueue[Any]", route: str):
+        super().__init__(log_queue)
+        self.route = route
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.log_route = self.route
+        return record
+
+
+class _RouteHandler(logging.Handler):
+    """Listener-side handler passing each record to its route's sinks"""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        for handler in _ROUTES.get(getattr(record, "log_route", ""), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+
+# One queue and one listener thread serve every configured logger, so
+# records from all modules are written in the order they were logged.
+# _ROUTES maps each name passed to setup_logger() to its sink handlers.
+_LOG_QUEUE: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_ROUTES: Dict[str, Tuple[logging.Handler, ...]] = {}
+_listener: Optional[logging.handlers.QueueListener] = None
+# One FileHandler per resolved path, so loggers writing to the same file
+# share a single handle and their records never interleave mid-line
+_file_handlers: Dict[str, logging.FileHandler] = {}
+_listener_lock = threading.Lock()
+
+
+def _start_listener() -> None:
+    """Start the shared listener thread once per process"""
+    global _listener
+    if _listener is None:
+        _listener = logging.handlers.QueueListener(_LOG_QUEUE, _RouteHandler())
+        _listener.start()
+        atexit.register(_listener.stop)
+
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging"""
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -33,7 +125,7 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra"):
             log_data.update(record.extra)
         
-        return json.dumps(log_data)
+        return _json_dumps(log_data)
 
 
 class SanitizedFormatter(logging.Formatter):
@@ -44,43 +136,58 @@ class SanitizedFormatter(logging.Formatter):
         "authorization", "auth", "credential", "access_token", "refresh_token"
     }
     
+    # Exact-match fast path, then one compiled scan for keys that merely
+    # contain a sensitive word (e.g. "openai_api_key")
+    _SENSITIVE_EXACT = frozenset(key.lower() for key in SENSITIVE_KEYS)
+    _SENSITIVE_RE = re.compile(
+        "|".join(map(re.escape, sorted(_SENSITIVE_EXACT, key=len, reverse=True)))
+    )
+    
+    def _is_sensitive(self, key: str) -> bool:
+        key_lower = key.lower()
+        return key_lower in self._SENSITIVE_EXACT or self._SENSITIVE_RE.search(key_lower) is not None
+    
     def _sanitize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively sanitize dictionary values"""
-        sanitized = {}
-        for key, value in data.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in self.SENSITIVE_KEYS):
-                sanitized[key] = "***REDACTED***"
-            elif isinstance(value, dict):
-                sanitized[key] = self._sanitize_dict(value)
-            elif isinstance(value, list):
-                sanitized[key] = [
-                    self._sanitize_dict(item) if isinstance(item, dict) else item
-                    for item in value
-                ]
-            else:
-                sanitized[key] = value
+        """Sanitize dictionary values, descending into nested dicts and lists"""
+        sanitized: Dict[str, Any] = {}
+        child: Dict[str, Any]
+        stack = deque(((data, sanitized),))
+        while stack:
+            source, target = stack.pop()
+            for key, value in source.items():
+                if self._is_sensitive(key):
+                    target[key] = "***REDACTED***"
+                elif isinstance(value, dict):
+                    target[key] = child = {}
+                    stack.append((value, child))
+                elif isinstance(value, list):
+                    items = target[key] = []
+                    for item in value:
+                        if isinstance(item, dict):
+                            child = {}
+                            stack.append((item, child))
+                            items.append(child)
+                        else:
+                            items.append(item)
+                else:
+                    target[key] = value
         return sanitized
     
     def format(self, record: logging.LogRecord) -> str:
-        # Create a copy of the record
-        record_copy = logging.makeLogRecord(record.__dict__)
-        
-        # Sanitize extra fields
-        if hasattr(record, "extra"):
-            record_copy.extra = self._sanitize_dict(record.extra)
-        
-        # Format message
-        message = record.getMessage()
+        original_extra = getattr(record, "extra", None)
         
-        # Sanitize message if it contains sensitive data
-        if any(key in message.lower() for key in self.SENSITIVE_KEYS):
-            # Simple sanitization - replace potential secrets
-            for key in self.SENSITIVE_KEYS:
-                # This is a basic implementation
-                pass
+        # Fast path: most records carry no extra dict, so there is nothing
+        # to sanitize
+        if original_extra is None:
+            return super().format(record)
         
-        return super().format(record_copy)
+        # Swap in sanitized extra fields for the duration of the call rather
+        # than copying the whole record
+        record.extra = self._sanitize_dict(original_extra)
+        try:
+            return super().format(record)
+        finally:
+            record.extra = original_extra
 
 
 def setup_logger(
@@ -93,6 +200,10 @@ def setup_logger(
     """
     Set up a logger with configured handlers
     
+    The handlers run on a single process-wide listener thread shared by all
+    configured loggers; calling this again for the same name replaces its
+    handlers.
+    
     Args:
         name: Logger name
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -110,6 +221,7 @@ def setup_logger(
     logger.handlers.clear()
     
     # Create formatter
+    formatter: logging.Formatter
     if json_format:
         formatter = JSONFormatter()
     elif sanitize:
@@ -127,17 +239,39 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
     # File handler (if specified)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file)
+        with _listener_lock:
+            file_handler = _file_handlers.get(str(log_path.resolve()))
+            if file_handler is None:
+                # Flushes after every record, like the stock handler
+                file_handler = logging.FileHandler(log_file)
+                _file_handlers[str(log_path.resolve())] = file_handler
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Formatting and I/O run on the shared listener thread; callers only
+    # enqueue
+    with _listener_lock:
+        previous = _ROUTES.get(name, ())
+        _ROUTES[name] = tuple(handlers)
+        _start_listener()
+        # File handlers are shared by every route logging to the same path;
+        # only close what no route uses any more
+        in_use = {handler for route in _ROUTES.values() for handler in route}
+        stale = [handler for handler in previous if handler not in in_use]
+        for path, shared in list(_file_handlers.items()):
+            if shared in stale:
+                del _file_handlers[path]
+    for handler in stale:
+        handler.close()
+    logger.addHandler(_RecordQueueHandler(_LOG_QUEUE, name))
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -145,6 +279,10 @@ def setup_logger(
     return logger
 
 
+_PACKAGE_LOGGER = "api_wrapper"
+_setup_lock = threading.Lock()
+
+
 def get_logger(name: str = "api_wrapper") -> logging.Logger:
     """
     Get or create a logger instance
@@ -155,27 +293,35 @@ def get_logger(name: str = "api_wrapper") -> logging.Logger:
     Returns:
         Logger instance
     """
-    logger = logging.getLogger(name)
+    # Module loggers below "api_wrapper" propagate to the package logger,
+    # which owns the only handler; configure that one on first use
+    if name == _PACKAGE_LOGGER or name.startswith(_PACKAGE_LOGGER + "."):
+        setup_name = _PACKAGE_LOGGER
+    else:
+        setup_name = name
     
     # If logger has no handlers, set it up with defaults
-    if not logger.handlers:
-        log_level = os.getenv("LOG_LEVEL", "INFO")
-        log_file = os.getenv("LOG_FILE")
-        json_format = os.getenv("LOG_JSON", "false").lower() == "true"
-        
-        logger = setup_logger(
-            name=name,
-            level=log_level,
-            log_file=log_file,
-            json_format=json_format,
-        )
+    if not logging.getLogger(setup_name).handlers:
+        with _setup_lock:
+            if not logging.getLogger(setup_name).handlers:
+                setup_logger(
+                    name=setup_name,
+                    level=os.getenv("LOG_LEVEL", "INFO"),
+                    log_file=os.getenv("LOG_FILE"),
+                    json_format=os.getenv("LOG_JSON", "false").lower() == "true",
+                )
     
-    return logger
+    return logging.getLogger(name)
 
 
 class RequestLogger:
     """Context manager for logging API requests and responses"""
     
+    # Allocated per API call; skip the per-instance __dict__
+    __slots__ = (
+        "logger", "operation", "model", "provider", "kwargs", "_start_ns", "duration"
+    )
+    
     def __init__(
         self,
         logger: logging.Logger,
@@ -189,12 +335,19 @@ class RequestLogger:
         self.model = model
         self.provider = provider
         self.kwargs = kwargs
-        self.start_time = None
+        self._start_ns = 0
+        # Seconds spent inside the block; set on exit whether or not the
+        # log line is emitted
+        self.duration: Optional[float] = None
     
     def __enter__(self):
-        self.start_time = datetime.utcnow()
+        self._start_ns = time.monotonic_ns()
+        if not self.logger.isEnabledFor(logging.INFO):
+            return self
+        
         self.logger.info(
-            f"Starting {self.operation}",
+            "Starting %s",
+            self.operation,
             extra={
                 "operation": self.operation,
                 "model": self.model,
@@ -205,11 +358,14 @@ class RequestLogger:
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = (datetime.utcnow() - self.start_time).total_seconds()
+        duration = self.duration = (time.monotonic_ns() - self._start_ns) * 1e-9
         
         if exc_type is None:
+            if not self.logger.isEnabledFor(logging.INFO):
+                return False
             self.logger.info(
-                f"Completed {self.operation}",
+                "Completed %s",
+                self.operation,
                 extra={
                     "operation": self.operation,
                     "model": self.model,
@@ -219,8 +375,12 @@ class RequestLogger:
                 }
             )
         else:
+            if not self.logger.isEnabledFor(logging.ERROR):
+                return False
             self.logger.error(
-                f"Failed {self.operation}: {exc_val}",
+                "Failed %s: %s",
+                self.operation,
+                exc_val,
                 extra={
                     "operation": self.operation,
                     "model": self.model,
@@ -234,4 +394,3 @@ class RequestLogger:
             )
         
         return False  # Don't suppress exceptions
-
@@ -4,7 +4,7 @@ Supports Prometheus and StatsD export formats
 """
 
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from collections import defaultdict
 from dataclasses import dataclass
 import threading
@@ -41,14 +41,84 @@ class MetricsCollector:
     def __init__(self):
         self.metrics: list = []
         self.lock = threading.Lock()
-        self.logger = get_logger("api_wrapper.metrics")
-
-        # Aggregated stats
-        self.request_count = defaultdict(int)
-        self.error_count = defaultdict(int)
-        self.total_tokens = defaultdict(int)
-        self.total_duration = defaultdict(float)
-        self.provider_availability = defaultdict(lambda: {"success": 0, "total": 0})
+        self.logger = logger
+
+        # Each recording thread owns a shard of counters, so record_request
+        # never takes the global lock; get_stats merges the shards on demand.
+        # reset() bumps the generation so threads start fresh shards.
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Dict[str, Any]]] = []
+        self._generation = 0
+        # Counters folded in from shards whose thread has exited
+        self._retired = self._new_shard()
+        # "provider:model" (and "provider:model:error") labels, built once per
+        # combination; cardinality is small so the cache is never evicted
+        self._key_cache: Dict[tuple, str] = {}
+
+    @staticmethod
+    def _new_shard() -> Dict[str, Any]:
+        return {
+            # key -> index into rows; each row is
+            # [request_count, error_count, total_tokens, total_duration]
+            "key_index": {},
+            "rows": [],
+            "error_types": defaultdict(int),
+            "provider_availability": defaultdict(lambda: {"success": 0, "total": 0}),
+            # Running [requests, errors] totals for this shard
+            "totals": [0, 0],
+        }
+
+    def _get_shard(self) -> Dict[str, Any]:
+        local = self._local
+        shard = getattr(local, "shard", None)
+        if shard is None or local.generation != self._generation:
+            shard = self._new_shard()
+            with self.lock:
+                # Short-lived threads come and go, so retire dead shards here
+                # to keep their number bounded by the live thread count
+                self._compact_shards()
+                self._shards.append((threading.current_thread(), shard))
+                local.generation = self._generation
+            local.shard = shard
+        return shard
+
+    def _compact_shards(self):
+        """Fold shards of exited threads into the retired totals (lock held)"""
+        live = []
+        for owner, shard in self._shards:
+            if owner.is_alive():
+                live.append((owner, shard))
+            else:
+                # A dead thread can no longer write to its shard
+                self._merge_shard(self._retired, shard)
+        if len(live) != len(self._shards):
+            self._shards = live
+
+    @staticmethod
+    def _merge_shard(target: Dict[str, Any], source: Dict[str, Any]):
+        """Add the counters of source into target"""
+        key_index = target["key_index"]
+        rows = target["rows"]
+        source_rows = source["rows"]
+        for key, idx in source["key_index"].items():
+            source_row = source_rows[idx]
+            target_idx = key_index.get(key)
+            if target_idx is None:
+                key_index[key] = len(rows)
+                rows.append(list(source_row))
+            else:
+                row = rows[target_idx]
+                for i, value in enumerate(source_row):
+                    row[i] += value
+        for key, count in source["error_types"].items():
+            target["error_types"][key] += count
+        for provider, counts in source["provider_availability"].items():
+            merged = target["provider_availability"][provider]
+            merged["success"] += counts["success"]
+            merged["total"] += counts["total"]
+        totals = target["totals"]
+        totals[0] += source["totals"][0]
+        totals[1] += source["totals"][1]
 
     def record_request(
         self,
@@ -72,22 +142,44 @@ class MetricsCollector:
             tokens_used: Number of tokens used
             response_length: Response length in characters
         """
-        with self.lock:
-            key = f"{provider}:{model}"
-            self.request_count[key] += 1
-            self.total_duration[key] += duration
-
-            if tokens_used:
-                self.total_tokens[key] += tokens_used
-
-            # Update provider availability
-            self.provider_availability[provider]["total"] += 1
-            if success:
-                self.provider_availability[provider]["success"] += 1
-            else:
-                self.error_count[key] += 1
-                if error_type:
-                    self.error_count[f"{key}:{error_type}"] += 1
+        shard = self._get_shard()
+        key = self._key_cache.get((provider, model))
+        if key is None:
+            key = self._key_cache.setdefault((provider, model), f"{provider}:{model}")
+
+        key_index = shard["key_index"]
+        rows = shard["rows"]
+        idx = key_index.get(key)
+        if idx is None:
+            # Append before publishing the index so readers never see a
+            # key without its row
+            idx = len(rows)
+            rows.append([0, 0, 0, 0.0])
+            key_index[key] = idx
+        row = rows[idx]
+        row[0] += 1
+        row[3] += duration
+
+        if tokens_used:
+            row[2] += tokens_used
+
+        # Update provider availability
+        totals = shard["totals"]
+        totals[0] += 1
+        availability = shard["provider_availability"][provider]
+        availability["total"] += 1
+        if success:
+            availability["success"] += 1
+        else:
+            totals[1] += 1
+            row[1] += 1
+            if error_type:
+                error_key = self._key_cache.get((key, error_type))
+                if error_key is None:
+                    error_key = self._key_cache.setdefault(
+                        (key, error_type), f"{key}:{error_type}"
+                    )
+                shard["error_types"][error_key] += 1
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -96,43 +188,81 @@ class MetricsCollector:
         Returns:
             Dictionary with statistics
         """
+        request_count: Dict[str, int] = defaultdict(int)
+        error_count: Dict[str, int] = defaultdict(int)
+        total_tokens: Dict[str, int] = defaultdict(int)
+        total_duration: Dict[str, float] = defaultdict(float)
+        provider_availability: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"success": 0, "total": 0}
+        )
+        total_requests = 0
+        total_errors = 0
+
         with self.lock:
-            stats = {
-                "request_counts": dict(self.request_count),
-                "error_counts": dict(self.error_count),
-                "total_tokens": dict(self.total_tokens),
-                "provider_availability": {},
+            self._compact_shards()
+            # dict() snapshots each table in one C-level copy, so owning
+            # threads can keep inserting keys while we merge
+            for shard in [self._retired] + [shard for _, shard in self._shards]:
+                rows = shard["rows"]
+                for key, idx in dict(shard["key_index"]).items():
+                    count, errors, tokens, duration = rows[idx]
+                    request_count[key] += count
+                    total_duration[key] += duration
+                    if errors:
+                        error_count[key] += errors
+                    if tokens:
+                        total_tokens[key] += tokens
+                for key, count in dict(shard["error_types"]).items():
+                    error_count[key] += count
+                for provider, counts in dict(shard["provider_availability"]).items():
+                    merged = provider_availability[provider]
+                    merged["success"] += counts["success"]
+                    merged["total"] += counts["total"]
+                total_requests += shard["totals"][0]
+                total_errors += shard["totals"][1]
+
+        stats: Dict[str, Any] = {
+            "request_counts": dict(request_count),
+            "error_counts": dict(error_count),
+            "total_tokens": dict(total_tokens),
+            "provider_availability": {},
+            "total_requests": total_requests,
+            "total_errors": total_errors,
+            "error_rate_percent": (
+                total_errors / total_requests * 100
+                if total_requests > 0 else 0.0
+            ),
+        }
+
+        # Calculate availability percentages
+        for provider, counts in provider_availability.items():
+            total = counts["total"]
+            success = counts["success"]
+            stats["provider_availability"][provider] = {
+                "total_requests": total,
+                "successful_requests": success,
+                "availability_percent": (success / total * 100) if total > 0 else 0.0,
             }
 
-            # Calculate availability percentages
-            for provider, counts in self.provider_availability.items():
-                total = counts["total"]
-                success = counts["success"]
-                stats["provider_availability"][provider] = {
-                    "total_requests": total,
-                    "successful_requests": success,
-                    "availability_percent": (success / total * 100) if total > 0 else 0.0,
-                }
+        # Calculate average durations
+        avg_durations = {}
+        for key, duration_sum in total_duration.items():
+            count = request_count.get(key, 1)
+            avg_durations[key] = duration_sum / count if count > 0 else 0.0
 
-            # Calculate average durations
-            avg_durations = {}
-            for key, total_duration in self.total_duration.items():
-                count = self.request_count.get(key, 1)
-                avg_durations[key] = total_duration / count if count > 0 else 0.0
+        stats["average_durations"] = avg_durations
 
-            stats["average_durations"] = avg_durations
-
-            return stats
+        return stats
 
     def reset(self):
         """Reset all metrics"""
         with self.lock:
             self.metrics.clear()
-            self.request_count.clear()
-            self.error_count.clear()
-            self.total_tokens.clear()
-            self.total_duration.clear()
-            self.provider_availability.clear()
+            # Recording threads notice the new generation and start fresh
+            # shards, so no shard is cleared underneath its owner
+            self._shards = []
+            self._retired = self._new_shard()
+            self._generation += 1
             self.logger.info("Metrics reset")
 
     def export_prometheus(self) -> str:
@@ -142,52 +272,51 @@ class MetricsCollector:
         Returns:
             Prometheus-formatted metrics string
         """
-        with self.lock:
-            stats = self.get_stats()
-            lines = []
-
-            # Request counts
-            for key, count in stats.get("request_counts", {}).items():
-                provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
-                lines.append(
-                    f'api_wrapper_requests_total{{provider="{provider}",model="{model}"}} {count}'
-                )
-
-            # Error counts
-            for key, count in stats.get("error_counts", {}).items():
-                if ":" in key:
-                    parts = key.split(":")
-                    if len(parts) == 2:
-                        provider, model = parts
-                        error_type = "unknown"
-                    else:
-                        provider, model, error_type = parts
-                    lines.append(
-                        f'api_wrapper_errors_total{{provider="{provider}",model="{model}",error_type="{error_type}"}} {count}'
-                    )
-
-            # Token usage
-            for key, tokens in stats.get("total_tokens", {}).items():
-                provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
-                lines.append(
-                    f'api_wrapper_tokens_total{{provider="{provider}",model="{model}"}} {tokens}'
-                )
-
-            # Average durations
-            for key, duration in stats.get("average_durations", {}).items():
-                provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
-                lines.append(
-                    f'api_wrapper_request_duration_seconds{{provider="{provider}",model="{model}"}} {duration:.4f}'
-                )
-
-            # Provider availability
-            for provider, availability in stats.get("provider_availability", {}).items():
-                avail_pct = availability.get("availability_percent", 0.0)
+        stats = self.get_stats()
+        lines = []
+
+        # Request counts
+        for key, count in stats.get("request_counts", {}).items():
+            provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
+            lines.append(
+                f'api_wrapper_requests_total{{provider="{provider}",model="{model}"}} {count}'
+            )
+
+        # Error counts
+        for key, count in stats.get("error_counts", {}).items():
+            if ":" in key:
+                parts = key.split(":")
+                if len(parts) == 2:
+                    provider, model = parts
+                    error_type = "unknown"
+                else:
+                    provider, model, error_type = parts
                 lines.append(
-                    f'api_wrapper_provider_availability{{provider="{provider}"}} {avail_pct:.2f}'
+                    f'api_wrapper_errors_total{{provider="{provider}",model="{model}",error_type="{error_type}"}} {count}'
                 )
 
-            return "\n".join(lines) + "\n"
+        # Token usage
+        for key, tokens in stats.get("total_tokens", {}).items():
+            provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
+            lines.append(
+                f'api_wrapper_tokens_total{{provider="{provider}",model="{model}"}} {tokens}'
+            )
+
+        # Average durations
+        for key, duration in stats.get("average_durations", {}).items():
+            provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
+            lines.append(
+                f'api_wrapper_request_duration_seconds{{provider="{provider}",model="{model}"}} {duration:.4f}'
+            )
+
+        # Provider availability
+        for provider, availability in stats.get("provider_availability", {}).items():
+            avail_pct = availability.get("availability_percent", 0.0)
+            lines.append(
+                f'api_wrapper_provider_availability{{provider="{provider}"}} {avail_pct:.2f}'
+            )
+
+        return "\n".join(lines) + "\n"
 
     def export_json(self) -> str:
         """
@@ -196,9 +325,8 @@ class MetricsCollector:
         Returns:
             JSON-formatted metrics string
         """
-        with self.lock:
-            stats = self.get_stats()
-            return json.dumps(stats, indent=2)
+        stats = self.get_stats()
+        return json.dumps(stats, indent=2)
 
     def export_statsd(self) -> List[str]:
         """
@@ -207,56 +335,73 @@ class MetricsCollector:
         Returns:
             List of StatsD metric strings
         """
-        with self.lock:
-            stats = self.get_stats()
-            lines = []
-            timestamp = int(time.time())
-
-            # Request counts
-            for key, count in stats.get("request_counts", {}).items():
-                provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
+        stats = self.get_stats()
+        lines = []
+        timestamp = int(time.time())
+
+        # Request counts
+        for key, count in stats.get("request_counts", {}).items():
+            provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
+            lines.append(
+                f'api_wrapper.requests.{provider}.{model}:{count}|c|#{timestamp}'
+            )
+
+        # Error counts
+        for key, count in stats.get("error_counts", {}).items():
+            if ":" in key:
+                parts = key.split(":")
+                if len(parts) == 2:
+                    provider, model = parts
+                    error_type = "unknown"
+                else:
+                    provider, model, error_type = parts
                 lines.append(
-                    f'api_wrapper.requests.{provider}.{model}:{count}|c|#{timestamp}'
+                    f'api_wrapper.errors.{provider}.{model}.{error_type}:{count}|c|#{timestamp}'
                 )
 
-            # Error counts
-            for key, count in stats.get("error_counts", {}).items():
-                if ":" in key:
-                    parts = key.split(":")
-                    if len(parts) == 2:
-                        provider, model = parts
-                        error_type = "unknown"
-                    else:
-                        provider, model, error_type = parts
-                    lines.append(
-                        f'api_wrapper.errors.{provider}.{model}.{error_type}:{count}|c|#{timestamp}'
-                    )
-
-            # Average durations
-            for key, duration in stats.get("average_durations", {}).items():
-                provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
-                lines.append(
-                    f'api_wrapper.duration.{provider}.{model}:{duration:.4f}|ms|#{timestamp}'
-                )
+        # Average durations
+        for key, duration in stats.get("average_durations", {}).items():
+            provider, model = key.split(":", 1) if ":" in key else (key, "unknown")
+            lines.append(
+                f'api_wrapper.duration.{provider}.{model}:{duration:.4f}|ms|#{timestamp}'
+            )
 
-            return lines
+        return lines
 
 
 # Global metrics collector
 _metrics_collector: Optional[MetricsCollector] = None
+_metrics_collector_lock = threading.Lock()
 
 
 def get_metrics_collector() -> MetricsCollector:
     """Get or create metrics collector instance"""
     global _metrics_collector
-    if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
-    return _metrics_collector
+    # Double-checked so concurrent first callers share one instance
+    instance = _metrics_collector
+    if instance is None:
+        with _metrics_collector_lock:
+            if _metrics_collector is None:
+                _metrics_collector = MetricsCollector()
+            instance = _metrics_collector
+    return instance
 
 
 class MetricsContext:
     """Context manager for tracking request metrics"""
 
+    # Allocated per API call; skip the per-instance __dict__
+    __slots__ = (
+        "collector",
+        "provider",
+        "model",
+        "_start_ns",
+        "success",
+        "error_type",
+        "tokens_used",
+        "response_length",
+    )
+
     def __init__(
         self,
         collector: MetricsCollector,
@@ -266,7 +411,7 @@ class MetricsContext:
         self.collector = collector
         self.provider = provider
         self.model = model
-        self.start_time = time.time()
+        self._start_ns = time.monotonic_ns()
         self.success = False
         self.error_type = None
         self.tokens_used = None
@@ -276,7 +421,7 @@ class MetricsContext:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
+        duration = (time.monotonic_ns() - self._start_ns) * 1e-9
         self.success = exc_type is None
 
         if exc_type:
@@ -2,18 +2,22 @@
 OpenAI API Client for chatbot interactions
 """
 
-from typing import Dict, List, Optional, Union, Any, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Union, Any, Iterator, Tuple
+import httpx
 import openai
 from openai import OpenAI
 
 from .config import (
     OPENAI_API_KEY,
+    OPENAI_CHATBOT_MODELS,
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
     DEFAULT_TOP_P,
 )
 from .logger import get_logger
 from .exceptions import (
+    ChatbotAPIError,
     APIError,
     RateLimitError,
     AuthenticationError,
@@ -30,13 +34,20 @@ class OpenAIClient:
     Client for interacting with OpenAI's chat models
     """
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_connections: int = 16,
+    ):
         """
         Initialize OpenAI client
 
         Args:
             api_key: OpenAI API key (if None, uses OPENAI_API_KEY env var)
             base_url: Custom base URL for API (optional, for compatible APIs)
+            max_connections: Size of the keep-alive connection pool shared by
+                all calls, including concurrent ``batch_chat`` workers
         """
         self.logger = get_logger("api_wrapper.openai_client")
         self.api_key = api_key or OPENAI_API_KEY
@@ -45,7 +56,18 @@ class OpenAIClient:
                 "OpenAI API key is required. Set OPENAI_API_KEY environment variable or pass api_key parameter."
             )
 
-        self.client = OpenAI(api_key=self.api_key, base_url=base_url)
+        self._http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            follow_redirects=True,
+        )
+        self.client = OpenAI(
+            api_key=self.api_key,
+            base_url=base_url,
+            http_client=self._http_client,
+        )
         self.logger.info("OpenAI client initialized successfully")
 
     def chat(
@@ -150,6 +172,44 @@ class OpenAIClient:
                 details={"model": model, "error": str(e), "error_type": type(e).__name__}
             )
 
+    def batch_chat(
+        self,
+        requests: List[Dict[str, Any]],
+        max_workers: int = 16,
+    ) -> Iterator[Tuple[int, Union[Dict[str, Any], ChatbotAPIError]]]:
+        """
+        Run several chat requests concurrently
+
+        Each request is a dict of keyword arguments for :meth:`chat`. The
+        underlying OpenAI client is thread-safe and its connection pool is
+        shared, so workers reuse keep-alive connections instead of paying a
+        TCP/TLS handshake per call. A failed request does not stop the batch;
+        its exception is yielded in place of the response.
+
+        Args:
+            requests: List of ``chat`` keyword-argument dicts
+            max_workers: Maximum number of requests in flight
+
+        Yields:
+            ``(index, response)`` tuples in completion order, where ``index``
+            is the position of the request in ``requests`` and ``response`` is
+            the :meth:`chat` result or the exception it raised
+        """
+        if not requests:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(requests))) as executor:
+            futures = {
+                executor.submit(self.chat, **request): index
+                for index, request in enumerate(requests)
+            }
+            for future in as_completed(futures):
+                try:
+                    result: Union[Dict[str, Any], ChatbotAPIError] = future.result()
+                except ChatbotAPIError as e:
+                    result = e
+                yield futures[future], result
+
     def stream_chat(
         self,
         model: str,
@@ -196,12 +256,58 @@ class OpenAIClient:
         except Exception as e:
             raise Exception(f"OpenAI streaming request failed: {str(e)}")
 
+    def stream_chat_batched(
+        self,
+        model: str,
+        messages: Union[str, List[Dict[str, str]]],
+        batch_chars: int = 256,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Stream chat responses in batches of at least ``batch_chars`` characters
+
+        Coalesces the per-token deltas of :meth:`stream_chat` so UI buffers
+        and socket forwarders handle one write per batch instead of one per
+        token. Use :meth:`stream_chat` when first-token latency matters.
+
+        Args:
+            model: OpenAI model identifier
+            messages: Either a string prompt or list of message dicts
+            batch_chars: Minimum number of characters per yielded chunk
+            **kwargs: Additional parameters passed to :meth:`stream_chat`
+
+        Yields:
+            String chunks of the response
+        """
+        buf: List[str] = []
+        size = 0
+        for content in self.stream_chat(model, messages, **kwargs):
+            buf.append(content)
+            size += len(content)
+            if size >= batch_chars:
+                yield "".join(buf)
+                buf.clear()
+                size = 0
+        if buf:
+            yield "".join(buf)
+
     def list_available_models(self) -> List[str]:
         """List available OpenAI models"""
-        from .config import OPENAI_CHATBOT_MODELS
         return list(OPENAI_CHATBOT_MODELS.keys())
 
     def get_model_info(self, model: str) -> Dict[str, Any]:
         """Get information about a specific model"""
-        from .config import OPENAI_CHATBOT_MODELS
-        return OPENAI_CHATBOT_MODELS.get(model, {})
+        spec = OPENAI_CHATBOT_MODELS.get(model)
+        return spec.to_dict() if spec else {}
+
+    def close(self):
+        """Close the pooled HTTP client and release its connections"""
+        self.client.close()
+        self._http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
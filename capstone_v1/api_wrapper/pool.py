@@ -2,8 +2,9 @@
 Connection pooling for HTTP clients
 """
 
+import threading
 import requests
-from typing import Optional
+from typing import Dict, Optional
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -53,7 +54,12 @@ class ConnectionPool:
             max_retries=retry_strategy
         )
         
-        self.logger = get_logger("api_wrapper.connection_pool")
+        # One long-lived Session per base URL so keep-alive connections are
+        # actually reused across get_session() calls
+        self._sessions: Dict[str, requests.Session] = {}
+        self._sessions_lock = threading.Lock()
+        
+        self.logger = logger
         self.logger.info(
             f"Connection pool initialized (connections={pool_connections}, "
             f"maxsize={pool_maxsize}, retries={max_retries})"
@@ -63,32 +69,51 @@ class ConnectionPool:
         """
         Get a session with connection pooling configured
         
+        Sessions are cached per ``base_url`` and shared between callers.
+        
         Args:
             base_url: Optional base URL for the session
         
         Returns:
             Configured requests.Session
         """
-        session = requests.Session()
+        key = base_url or "*"
+        session = self._sessions.get(key)
+        if session is not None:
+            return session
         
-        if base_url:
-            session.mount(base_url, self.adapter)
-        else:
-            # Mount for all HTTP/HTTPS
-            session.mount("http://", self.adapter)
-            session.mount("https://", self.adapter)
+        with self._sessions_lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = requests.Session()
+                session.headers.update({"Connection": "keep-alive"})
+                
+                if base_url:
+                    session.mount(base_url, self.adapter)
+                else:
+                    # Mount for all HTTP/HTTPS
+                    session.mount("http://", self.adapter)
+                    session.mount("https://", self.adapter)
+                
+                self._sessions[key] = session
         
         return session
 
 
 # Global connection pool instance
 _default_pool: Optional[ConnectionPool] = None
+_default_pool_lock = threading.Lock()
 
 
 def get_connection_pool() -> ConnectionPool:
     """Get or create default connection pool"""
     global _default_pool
-    if _default_pool is None:
-        _default_pool = ConnectionPool()
-    return _default_pool
+    # Double-checked so concurrent first callers share one instance
+    instance = _default_pool
+    if instance is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = ConnectionPool()
+            instance = _default_pool
+    return instance
 
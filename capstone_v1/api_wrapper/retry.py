@@ -2,6 +2,8 @@
 Retry logic with exponential backoff for API requests
 """
 
+import logging
+import threading
 import time
 import random
 from typing import Callable, TypeVar, Type, Tuple
@@ -13,6 +15,16 @@ from .logger import get_logger
 T = TypeVar('T')
 logger = get_logger("api_wrapper.retry")
 
+# Per-thread PRNG for jitter so concurrent retries don't share random._inst
+_tls = threading.local()
+
+
+def _rng() -> random.Random:
+    rng = getattr(_tls, "rng", None)
+    if rng is None:
+        rng = _tls.rng = random.Random()
+    return rng
+
 
 def exponential_backoff(
     max_retries: int = 3,
@@ -41,6 +53,12 @@ def exponential_backoff(
     Returns:
         Decorated function with retry logic
     """
+    # The backoff schedule is fixed at decoration time
+    delays = tuple(
+        min(initial_delay * (exponential_base ** attempt), max_delay)
+        for attempt in range(max_retries)
+    )
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
@@ -60,30 +78,31 @@ def exponential_backoff(
                         )
                         raise
 
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        initial_delay * (exponential_base ** attempt),
-                        max_delay
-                    )
+                    delay = delays[attempt]
 
                     # Add jitter if enabled
                     if jitter:
-                        jitter_amount = delay * 0.1 * random.random()
+                        jitter_amount = delay * 0.1 * _rng().random()
                         delay = delay + jitter_amount
 
                     # Handle rate limit retry-after
                     if isinstance(e, RateLimitError) and e.retry_after:
                         delay = max(delay, e.retry_after)
 
-                    logger.warning(
-                        f"Retrying {func.__name__} after {delay:.2f}s (attempt {attempt + 1}/{max_retries})",
-                        extra={
-                            "attempt": attempt + 1,
-                            "max_retries": max_retries,
-                            "delay": delay,
-                            "error": str(e)
-                        }
-                    )
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "Retrying %s after %.2fs (attempt %d/%d)",
+                            func.__name__,
+                            delay,
+                            attempt + 1,
+                            max_retries,
+                            extra={
+                                "attempt": attempt + 1,
+                                "max_retries": max_retries,
+                                "delay": delay,
+                                "error": str(e)
+                            }
+                        )
 
                     time.sleep(delay)
                 except Exception as e:
@@ -121,8 +140,27 @@ class RetryHandler:
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        # (settings, per-attempt delays) for the settings the table was built from
+        self._delay_cache: Tuple[Tuple[int, float, float, float], Tuple[float, ...]] = (
+            (-1, 0.0, 0.0, 0.0), ()
+        )
         self.logger = get_logger("api_wrapper.retry_handler")
 
+    def _delays(self) -> Tuple[float, ...]:
+        """Per-attempt backoff delays, rebuilt whenever the settings change"""
+        settings = (self.max_retries, self.initial_delay, self.max_delay, self.exponential_base)
+        cached_settings, delays = self._delay_cache
+        if cached_settings != settings:
+            max_retries, initial_delay, max_delay, exponential_base = settings
+            delays = tuple(
+                min(initial_delay * (exponential_base ** attempt), max_delay)
+                for attempt in range(max_retries)
+            )
+            # One tuple assignment, so concurrent callers never see a
+            # table paired with the wrong settings
+            self._delay_cache = (settings, delays)
+        return delays
+
     def execute(
         self,
         func: Callable[..., T],
@@ -151,41 +189,45 @@ class RetryHandler:
             Last exception if all retries fail
         """
         last_exception = None
+        # Snapshot the table so the retry count and delays stay consistent
+        # even if the settings are changed mid-call
+        delays = self._delays()
+        max_retries = len(delays)
 
-        for attempt in range(self.max_retries + 1):
+        for attempt in range(max_retries + 1):
             try:
                 return func(*args, **kwargs)
             except retryable_exceptions as e:
                 last_exception = e
 
-                if attempt >= self.max_retries:
+                if attempt >= max_retries:
                     self.logger.error(
-                        f"Max retries ({self.max_retries}) exceeded",
+                        f"Max retries ({max_retries}) exceeded",
                         extra={"attempt": attempt + 1, "error": str(e)}
                     )
                     raise
 
-                # Calculate delay
-                delay = min(
-                    self.initial_delay * (self.exponential_base ** attempt),
-                    self.max_delay
-                )
+                delay = delays[attempt]
 
                 if self.jitter:
-                    jitter_amount = delay * 0.1 * random.random()
+                    jitter_amount = delay * 0.1 * _rng().random()
                     delay = delay + jitter_amount
 
                 if isinstance(e, RateLimitError) and e.retry_after:
                     delay = max(delay, e.retry_after)
 
-                self.logger.warning(
-                    f"Retrying after {delay:.2f}s (attempt {attempt + 1}/{self.max_retries})",
-                    extra={
-                        "attempt": attempt + 1,
-                        "delay": delay,
-                        "error": str(e)
-                    }
-                )
+                if self.logger.isEnabledFor(logging.WARNING):
+                    self.logger.warning(
+                        "Retrying after %.2fs (attempt %d/%d)",
+                        delay,
+                        attempt + 1,
+                        max_retries,
+                        extra={
+                            "attempt": attempt + 1,
+                            "delay": delay,
+                            "error": str(e)
+                        }
+                    )
 
                 time.sleep(delay)
             except Exception as e:
@@ -3,7 +3,9 @@ Security utilities for input validation and sanitization
 """
 
 import re
-from typing import Union, List, Dict, Any, Optional
+import sys
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union, cast
 
 from .logger import get_logger
 from .exceptions import ValidationError
@@ -15,6 +17,26 @@ logger = get_logger("api_wrapper.security")
 MAX_MESSAGE_LENGTH = 100000
 MAX_MESSAGES_COUNT = 100
 
+# Characters rejected in model names; four C-level `in` scans beat the regex
+# engine on identifiers this short
+_MODEL_NAME_BAD_CHARS = '<>"\''
+
+# Message dict keys, interned once so lookups and the dicts we build share
+# the same key objects
+_ROLE = sys.intern("role")
+_CONTENT = sys.intern("content")
+# Distinguishes a missing key from one explicitly set to None
+_MISSING = object()
+
+_VALID_ROLES = frozenset({"system", "user", "assistant"})
+
+# Key fragments that mark a value as sensitive in sanitize_for_logging; the
+# exact set catches the common spellings with one hash lookup
+_SENSITIVE_SUBSTR = ("key", "token", "password", "secret", "auth", "credential")
+_SENSITIVE_EXACT = frozenset({
+    "api_key", "apikey", "authorization", "password", "token", "secret", "x-api-key",
+})
+
 
 def validate_message(message: Union[str, Dict[str, str]]) -> str:
     """
@@ -29,13 +51,24 @@ def validate_message(message: Union[str, Dict[str, str]]) -> str:
     Raises:
         ValidationError if message is invalid
     """
-    if isinstance(message, dict):
-        if "content" not in message:
+    # Exact type checks first; isinstance only runs for subclasses
+    content: Any
+    t = type(message)
+    if t is str:
+        content = message
+    elif t is dict or isinstance(message, dict):
+        content = cast(Dict[str, Any], message).get(_CONTENT, _MISSING)
+        if content is _MISSING:
             raise ValidationError(
                 "Message dict must contain 'content' key",
                 field="content"
             )
-        content = message["content"]
+        # Only dict payloads can carry a non-string content
+        if type(content) is not str and not isinstance(content, str):
+            raise ValidationError(
+                "Message content must be a string",
+                field="content"
+            )
     elif isinstance(message, str):
         content = message
     else:
@@ -44,44 +77,40 @@ def validate_message(message: Union[str, Dict[str, str]]) -> str:
             field="message"
         )
 
-    if not isinstance(content, str):
-        raise ValidationError(
-            "Message content must be a string",
-            field="content"
-        )
-
     if len(content) > MAX_MESSAGE_LENGTH:
         raise ValidationError(
             f"Message too long (max {MAX_MESSAGE_LENGTH} characters)",
             field="content"
         )
 
-    if len(content.strip()) == 0:
+    if not content or content.isspace():
         raise ValidationError(
             "Message content cannot be empty",
             field="content"
         )
 
-    return content
+    return cast(str, content)
 
 
-def validate_messages(messages: Union[str, List[Dict[str, str]]]) -> List[Dict[str, str]]:
+def _validate_and_size(
+    messages: Union[str, List[Dict[str, str]]],
+    max_total_size: Optional[int] = None,
+) -> Tuple[List[Dict[str, str]], int]:
     """
-    Validate and normalize messages
-
-    Args:
-        messages: Single message string or list of message dicts
+    Validate and normalize messages in one pass, summing content length
 
-    Returns:
-        List of validated message dicts
-
-    Raises:
-        ValidationError if messages are invalid
+    Raises as soon as the running size exceeds ``max_total_size`` so an
+    oversized request is rejected without validating the rest of it.
     """
-    if isinstance(messages, str):
-        return [{"role": "user", "content": validate_message(messages)}]
-
-    if not isinstance(messages, list):
+    t = type(messages)
+    if t is str or (t is not list and isinstance(messages, str)):
+        content = validate_message(cast(str, messages))
+        total_size = len(content)
+        if max_total_size is not None and total_size > max_total_size:
+            raise _request_too_large(max_total_size)
+        return [{_ROLE: "user", _CONTENT: content}], total_size
+
+    if t is not list and not isinstance(messages, list):
         raise ValidationError(
             f"Messages must be str or list, got {type(messages).__name__}",
             field="messages"
@@ -94,30 +123,80 @@ def validate_messages(messages: Union[str, List[Dict[str, str]]]) -> List[Dict[s
         )
 
     validated = []
+    total_size = 0
     for i, msg in enumerate(messages):
-        if not isinstance(msg, dict):
+        if type(msg) is not dict and not isinstance(msg, dict):
             raise ValidationError(
                 f"Message {i} must be a dict",
                 field=f"messages[{i}]"
             )
 
-        if "role" not in msg:
+        role = msg.get(_ROLE, _MISSING)
+        if role is _MISSING:
             raise ValidationError(
                 f"Message {i} missing 'role' field",
                 field=f"messages[{i}].role"
             )
 
-        role = msg["role"]
-        if role not in ["system", "user", "assistant"]:
+        if not isinstance(role, str) or role not in _VALID_ROLES:
             raise ValidationError(
                 f"Invalid role '{role}' in message {i} (must be 'system', 'user', or 'assistant')",
                 field=f"messages[{i}].role"
             )
 
-        content = validate_message(msg)
-        validated.append({"role": role, "content": content})
+        # validate_message's dict branch, inlined to save a call per message
+        content = msg.get(_CONTENT, _MISSING)
+        if content is _MISSING:
+            raise ValidationError(
+                "Message dict must contain 'content' key",
+                field="content"
+            )
+        if type(content) is not str and not isinstance(content, str):
+            raise ValidationError(
+                "Message content must be a string",
+                field="content"
+            )
+        size = len(content)
+        if size > MAX_MESSAGE_LENGTH:
+            raise ValidationError(
+                f"Message too long (max {MAX_MESSAGE_LENGTH} characters)",
+                field="content"
+            )
+        if not content or content.isspace():
+            raise ValidationError(
+                "Message content cannot be empty",
+                field="content"
+            )
+
+        total_size += size
+        if max_total_size is not None and total_size > max_total_size:
+            raise _request_too_large(max_total_size)
+        validated.append({_ROLE: role, _CONTENT: content})
+
+    return validated, total_size
+
+
+def _request_too_large(max_total_size: int) -> ValidationError:
+    return ValidationError(
+        f"Request too large (max {max_total_size} characters)",
+        field="messages"
+    )
+
+
+def validate_messages(messages: Union[str, List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """
+    Validate and normalize messages
+
+    Args:
+        messages: Single message string or list of message dicts
 
-    return validated
+    Returns:
+        List of validated message dicts
+
+    Raises:
+        ValidationError if messages are invalid
+    """
+    return _validate_and_size(messages)[0]
 
 
 def validate_model_name(model: str) -> str:
@@ -133,13 +212,13 @@ def validate_model_name(model: str) -> str:
     Raises:
         ValidationError if model name is invalid
     """
-    if not isinstance(model, str):
+    if type(model) is not str and not isinstance(model, str):
         raise ValidationError(
             f"Model must be a string, got {type(model).__name__}",
             field="model"
         )
 
-    if len(model.strip()) == 0:
+    if not model or model.isspace():
         raise ValidationError(
             "Model name cannot be empty",
             field="model"
@@ -152,7 +231,7 @@ def validate_model_name(model: str) -> str:
         )
 
     # Check for potentially dangerous characters
-    if re.search(r'[<>"\']', model):
+    if any(char in model for char in _MODEL_NAME_BAD_CHARS):
         raise ValidationError(
             "Model name contains invalid characters",
             field="model"
@@ -161,6 +240,66 @@ def validate_model_name(model: str) -> str:
     return model.strip()
 
 
+def _compile_numeric_range(
+    field: str,
+    lo: float,
+    hi: float,
+    type_error: str,
+    low_error: str,
+    high_error: str,
+    as_int: bool = False,
+) -> Callable[[Any], Any]:
+    """
+    Build a range check for a numeric parameter with fixed bounds
+
+    Bounds and messages are bound as closure constants, so a valid value
+    costs one type check and two comparisons; strings are only formatted on
+    the failure path.
+    """
+    if as_int:
+        def check(value):
+            t = type(value)
+            if t is not int and not isinstance(value, int):
+                raise ValidationError(f"{type_error}, got {t.__name__}", field=field)
+            if value < lo:
+                raise ValidationError(low_error, field=field)
+            if value > hi:
+                raise ValidationError(high_error, field=field)
+            return value
+    else:
+        def check(value):
+            t = type(value)
+            if not (t is float or t is int or isinstance(value, (int, float))):
+                raise ValidationError(f"{type_error}, got {t.__name__}", field=field)
+            if value < lo:
+                raise ValidationError(low_error, field=field)
+            if value > hi:
+                raise ValidationError(high_error, field=field)
+            return float(value)
+
+    return check
+
+
+_check_temperature = _compile_numeric_range(
+    "temperature",
+    0.0,
+    2.0,
+    type_error="Temperature must be a number",
+    low_error="Temperature must be between 0.0 and 2.0",
+    high_error="Temperature must be between 0.0 and 2.0",
+)
+
+_check_max_tokens = _compile_numeric_range(
+    "max_tokens",
+    1,
+    100000,
+    type_error="max_tokens must be an integer",
+    low_error="max_tokens must be at least 1",
+    high_error="max_tokens too large (max 100000)",
+    as_int=True,
+)
+
+
 def validate_temperature(temperature: float) -> float:
     """
     Validate temperature parameter
@@ -174,19 +313,7 @@ def validate_temperature(temperature: float) -> float:
     Raises:
         ValidationError if temperature is invalid
     """
-    if not isinstance(temperature, (int, float)):
-        raise ValidationError(
-            f"Temperature must be a number, got {type(temperature).__name__}",
-            field="temperature"
-        )
-
-    if temperature < 0.0 or temperature > 2.0:
-        raise ValidationError(
-            "Temperature must be between 0.0 and 2.0",
-            field="temperature"
-        )
-
-    return float(temperature)
+    return cast(float, _check_temperature(temperature))
 
 
 def validate_max_tokens(max_tokens: int) -> int:
@@ -202,25 +329,46 @@ def validate_max_tokens(max_tokens: int) -> int:
     Raises:
         ValidationError if max_tokens is invalid
     """
-    if not isinstance(max_tokens, int):
-        raise ValidationError(
-            f"max_tokens must be an integer, got {type(max_tokens).__name__}",
-            field="max_tokens"
-        )
+    return cast(int, _check_max_tokens(max_tokens))
 
-    if max_tokens < 1:
-        raise ValidationError(
-            "max_tokens must be at least 1",
-            field="max_tokens"
-        )
 
-    if max_tokens > 100000:
-        raise ValidationError(
-            "max_tokens too large (max 100000)",
-            field="max_tokens"
-        )
+def _is_sensitive_key(key: str) -> bool:
+    key_lower = key.lower()
+    return key_lower in _SENSITIVE_EXACT or any(
+        sensitive in key_lower for sensitive in _SENSITIVE_SUBSTR
+    )
+
+
+# Credential prefixes (OpenAI, HuggingFace, Slack, GitHub, AWS, bearer
+# headers). Keys are often embedded in longer strings ("token=hf_..."), so
+# the whole string is scanned with one precompiled alternation
+_KEY_PREFIXES = ("sk-", "hf_", "xoxb-", "ghp_", "gho_", "github_pat_", "AKIA", "Bearer ")
+_KEY_PREFIX_RE = re.compile("|".join(map(re.escape, _KEY_PREFIXES)))
+
+
+def _sanitize_str(data: str) -> str:
+    # Check if string contains something that looks like an API key
+    if len(data) > 20 and _KEY_PREFIX_RE.search(data):
+        return "***REDACTED***"
+    return data
+
 
-    return max_tokens
+# Exact-type table for sanitize_for_logging
+_KINDS: Dict[type, type] = {dict: dict, list: list, str: str}
+
+
+def _kind(value: Any) -> Optional[type]:
+    kind = _KINDS.get(type(value))
+    if kind is not None:
+        return kind
+    # Subclasses (OrderedDict, defaultdict, ...) miss the exact-type table
+    if isinstance(value, dict):
+        return dict
+    if isinstance(value, list):
+        return list
+    if isinstance(value, str):
+        return str
+    return None
 
 
 def sanitize_for_logging(data: Any) -> Any:
@@ -233,26 +381,37 @@ def sanitize_for_logging(data: Any) -> Any:
     Returns:
         Sanitized data
     """
-    if isinstance(data, dict):
-        sanitized = {}
-        for key, value in data.items():
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in [
-                "key", "token", "password", "secret", "auth", "credential"
-            ]):
-                sanitized[key] = "***REDACTED***"
-            else:
-                sanitized[key] = sanitize_for_logging(value)
-        return sanitized
-    elif isinstance(data, list):
-        return [sanitize_for_logging(item) for item in data]
-    elif isinstance(data, str):
-        # Check if string looks like an API key
-        if len(data) > 20 and any(char in data for char in ["sk-", "hf_", "xoxb-"]):
-            return "***REDACTED***"
-        return data
-    else:
+    kind = _kind(data)
+    if kind is None:
         return data
+    if kind is str:
+        return _sanitize_str(data)
+
+    # Walk nested containers with an explicit stack instead of recursion;
+    # each entry pairs a source container with its pre-allocated copy
+    root: Any = {} if kind is dict else [None] * len(data)
+    stack: Deque[Tuple[Any, Any, type]] = deque(((data, root, kind),))
+    key: Any
+    child: Any
+    while stack:
+        source, target, kind = stack.pop()
+        for key, value in (source.items() if kind is dict else enumerate(source)):
+            if kind is dict and _is_sensitive_key(key):
+                target[key] = "***REDACTED***"
+                continue
+
+            value_kind = _kind(value)
+            if value_kind is dict:
+                target[key] = child = {}
+                stack.append((value, child, dict))
+            elif value_kind is list:
+                target[key] = child = [None] * len(value)
+                stack.append((value, child, list))
+            elif value_kind is str:
+                target[key] = _sanitize_str(value)
+            else:
+                target[key] = value
+    return root
 
 
 def mask_api_key(api_key: Optional[str]) -> str:
@@ -287,13 +446,7 @@ def validate_request_size(messages: Union[str, List[Dict[str, str]]]) -> int:
     Raises:
         ValidationError if request is too large
     """
-    validated = validate_messages(messages)
-    total_size = sum(len(msg["content"]) for msg in validated)
-
-    if total_size > MAX_MESSAGE_LENGTH * MAX_MESSAGES_COUNT:
-        raise ValidationError(
-            f"Request too large (max {MAX_MESSAGE_LENGTH * MAX_MESSAGES_COUNT} characters)",
-            field="messages"
-        )
-
+    _, total_size = _validate_and_size(
+        messages, max_total_size=MAX_MESSAGE_LENGTH * MAX_MESSAGES_COUNT
+    )
     return total_size
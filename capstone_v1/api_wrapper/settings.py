@@ -2,6 +2,7 @@
 Pydantic-based configuration management with validation
 """
 
+import functools
 import os
 from typing import Optional
 from enum import Enum
@@ -39,6 +40,14 @@ from .logger import get_logger
 logger = get_logger("api_wrapper.settings")
 
 
+# Accepted values for the validated string settings; tuples keep the order
+# for error messages, frozensets back the membership checks
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LOG_LEVEL_SET = frozenset(_LOG_LEVELS)
+_HF_DEVICES = ("auto", "cpu", "cuda")
+_HF_DEVICE_SET = frozenset(_HF_DEVICES)
+
+
 class Environment(str, Enum):
     """Environment types"""
     DEVELOPMENT = "development"
@@ -92,33 +101,49 @@ if PYDANTIC_AVAILABLE:
             @field_validator("log_level")
             @classmethod
             def validate_log_level(cls, v):
-                valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-                if v.upper() not in valid_levels:
-                    raise ValueError(f"log_level must be one of {valid_levels}")
+                if v.upper() not in _LOG_LEVEL_SET:
+                    raise ValueError(f"log_level must be one of {list(_LOG_LEVELS)}")
                 return v.upper()
 
             @field_validator("hf_device")
             @classmethod
             def validate_hf_device(cls, v):
-                valid_devices = ["auto", "cpu", "cuda"]
-                if v.lower() not in valid_devices:
-                    raise ValueError(f"hf_device must be one of {valid_devices}")
+                if v.lower() not in _HF_DEVICE_SET:
+                    raise ValueError(f"hf_device must be one of {list(_HF_DEVICES)}")
                 return v.lower()
         else:
             @validator("log_level")
             def validate_log_level(cls, v):
-                valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-                if v.upper() not in valid_levels:
-                    raise ValueError(f"log_level must be one of {valid_levels}")
+                if v.upper() not in _LOG_LEVEL_SET:
+                    raise ValueError(f"log_level must be one of {list(_LOG_LEVELS)}")
                 return v.upper()
 
             @validator("hf_device")
             def validate_hf_device(cls, v):
-                valid_devices = ["auto", "cpu", "cuda"]
-                if v.lower() not in valid_devices:
-                    raise ValueError(f"hf_device must be one of {valid_devices}")
+                if v.lower() not in _HF_DEVICE_SET:
+                    raise ValueError(f"hf_device must be one of {list(_HF_DEVICES)}")
                 return v.lower()
 
+        @classmethod
+        def reload_trusted(cls, **overrides) -> "Settings":
+            """
+            Copy the cached settings with overrides, skipping validation
+
+            Uses ``model_construct`` (``construct`` on pydantic v1), so no
+            field validators run. Only pass values that are already known to
+            be valid, e.g. taken from another validated ``Settings``.
+            """
+            trusted: "Settings"
+            if PYDANTIC_V2:
+                values = get_settings().model_dump()
+                values.update(overrides)
+                trusted = cls.model_construct(**values)
+            else:
+                values = get_settings().dict()
+                values.update(overrides)
+                trusted = cls.construct(**values)
+            return trusted
+
         if PYDANTIC_V2:
             class Config:
                 env_file = ".env"
@@ -160,14 +185,21 @@ else:
                     "Install pydantic for full validation support."
                 )
 
-
-# Global settings instance
-_settings: Optional[Settings] = None
+        @classmethod
+        def reload_trusted(cls, **overrides) -> "Settings":
+            """Copy the cached settings with overrides, without re-reading the environment"""
+            settings = cls.__new__(cls)
+            settings.__dict__.update(vars(get_settings()))
+            settings.__dict__.update(overrides)
+            return settings
 
 
+@functools.lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create settings instance"""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    """
+    Get or create settings instance
+
+    The instance is cached for the life of the process; call
+    ``get_settings.cache_clear()`` (e.g. in tests) to re-read the environment.
+    """
+    return Settings()
@@ -76,8 +76,8 @@ def example_metrics_collection():
     # Get statistics
     print("\n2. Current Statistics:")
     stats = collector.get_stats()
-    print(f"   Total requests: {sum(stats['request_counts'].values())}")
-    print(f"   Total errors: {sum(stats['error_counts'].values())}")
+    print(f"   Total requests: {stats['total_requests']}")
+    print(f"   Total errors: {stats['total_errors']}")
     print(f"   Provider availability:")
     for provider, avail in stats.get('provider_availability', {}).items():
         print(f"     {provider}: {avail['availability_percent']:.1f}%")
@@ -14,12 +14,24 @@ from .models_registry import (
     OPENAI_MODELS,
     ALL_MODELS,
     get_model_info,
+    get_hf_model,
+    get_openai_model,
+    iter_hf_models,
+    iter_openai_models,
     list_models_by_provider,
     list_models_by_type,
     search_models,
     get_free_models,
     get_local_models,
+    filter_models,
+    by_provider,
+    by_type,
+    by_license,
+    by_env_var,
+    invalidate,
     export_to_dict,
+    asdict,
+    replace,
 )
 
 __all__ = [
@@ -33,11 +45,23 @@ __all__ = [
     "OPENAI_MODELS",
     "ALL_MODELS",
     "get_model_info",
+    "get_hf_model",
+    "get_openai_model",
+    "iter_hf_models",
+    "iter_openai_models",
     "list_models_by_provider",
     "list_models_by_type",
     "search_models",
     "get_free_models",
     "get_local_models",
+    "filter_models",
+    "by_provider",
+    "by_type",
+    "by_license",
+    "by_env_var",
+    "invalidate",
     "export_to_dict",
+    "asdict",
+    "replace",
 ]
 
@@ -3,10 +3,87 @@ Comprehensive Models Registry
 Contains full information and endpoints for publicly sourceable models
 """
 
-from typing import Dict, List, Optional, Any
+import copy
+import functools
+import sys
+from typing import (
+    AbstractSet, Any, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Set, Tuple,
+)
+import dataclasses
 from dataclasses import dataclass, field
 from enum import Enum
 
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+    MSGSPEC_AVAILABLE = False
+
+
+# Registry records are immutable after import. With msgspec they are
+# C-level Structs (cheap to build, not tracked by the cyclic GC); otherwise
+# they fall back to frozen dataclasses with the same fields and semantics.
+# The dataclasses module only understands the latter, so use asdict() and
+# replace() below rather than dataclasses.asdict/replace.
+if MSGSPEC_AVAILABLE:
+    class _Record(msgspec.Struct, frozen=True, gc=False, kw_only=True):
+        """Base for registry records"""
+
+    def _record(cls):
+        return cls
+
+    _field = msgspec.field
+else:
+    class _Record:  # type: ignore[no-redef]
+        """Base for registry records"""
+        __slots__ = ()
+
+        def __init_subclass__(cls, frozen: bool = False, **kwargs: Any) -> None:
+            # Records repeat msgspec's frozen=True class option so type
+            # checkers see them as frozen; _record applies it here instead
+            super().__init_subclass__(**kwargs)
+
+    # dataclass(slots=True) needs Python 3.10+; older interpreters keep a
+    # per-instance __dict__
+    if sys.version_info >= (3, 10):
+        _record = dataclass(frozen=True, slots=True)
+    else:
+        _record = dataclass(frozen=True)
+    _field = field  # type: ignore[assignment]
+
+
+def asdict(record: Any) -> Dict[str, Any]:
+    """
+    Convert a registry record (and any nested records) to a dict
+
+    Works for both record types, with the same result as
+    dataclasses.asdict on the dataclass fallback.
+    """
+    if not MSGSPEC_AVAILABLE:
+        return dataclasses.asdict(record)
+    as_dict: Dict[str, Any] = _struct_asdict(record)
+    return as_dict
+
+
+def _struct_asdict(obj: Any) -> Any:
+    # Mirrors dataclasses.asdict: records become dicts, containers are
+    # rebuilt and everything else is deep-copied
+    if isinstance(obj, msgspec.Struct):
+        return {name: _struct_asdict(getattr(obj, name)) for name in obj.__struct_fields__}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_struct_asdict(item) for item in obj)
+    if isinstance(obj, dict):
+        return {_struct_asdict(key): _struct_asdict(value) for key, value in obj.items()}
+    return copy.deepcopy(obj)
+
+
+def replace(record: Any, **changes: Any) -> Any:
+    """Return a copy of a registry record with the given fields replaced"""
+    if not MSGSPEC_AVAILABLE:
+        return dataclasses.replace(record, **changes)
+    return msgspec.structs.replace(record, **changes)
+
 
 class ModelType(str, Enum):
     """Model type categories"""
@@ -37,28 +114,28 @@ class LicenseType(str, Enum):
     LLAMA3_COMMUNITY = "Llama 3 Community License"
 
 
-@dataclass
-class ModelEndpoint:
+@_record
+class ModelEndpoint(_Record, frozen=True):
     """Model endpoint configuration"""
     url: str
     method: str = "POST"
-    headers: Dict[str, str] = field(default_factory=dict)
+    headers: Dict[str, str] = _field(default_factory=dict)
     auth_required: bool = True
     rate_limit: Optional[str] = None
 
 
-@dataclass
-class ModelSpecs:
+@_record
+class ModelSpecs(_Record, frozen=True):
     """Model specifications"""
     parameters: Optional[int] = None  # Number of parameters in billions
     context_window: Optional[int] = None  # Context window size in tokens
     architecture: Optional[str] = None  # Model architecture
-    quantization: Optional[List[str]] = None  # Available quantizations
-    precision: Optional[List[str]] = None  # Available precisions (fp16, fp32, etc.)
+    quantization: Optional[Tuple[str, ...]] = None  # Available quantizations
+    precision: Optional[Tuple[str, ...]] = None  # Available precisions (fp16, fp32, etc.)
 
 
-@dataclass
-class ModelInfo:
+@_record
+class ModelInfo(_Record, frozen=True):
     """Complete model information"""
     model_id: str
     name: str
@@ -90,8 +167,8 @@ class ModelInfo:
     free_tier_limits: Optional[str] = None
     
     # Usage information
-    recommended_use_cases: List[str] = field(default_factory=list)
-    limitations: List[str] = field(default_factory=list)
+    recommended_use_cases: Tuple[str, ...] = ()
+    limitations: Tuple[str, ...] = ()
     
     # Additional metadata
     paper_url: Optional[str] = None
@@ -100,493 +177,482 @@ class ModelInfo:
     model_card_url: Optional[str] = None
     
     # Technical details
-    supported_languages: List[str] = field(default_factory=lambda: ["en"])
+    supported_languages: Tuple[str, ...] = ("en",)
     max_output_tokens: Optional[int] = None
     default_temperature: float = 0.7
     default_max_tokens: int = 512
 
 
+# Values repeated across registry entries are shared module-level objects,
+# so every built record points at the same headers and language tuples. The
+# headers are a plain dict (treat it as read-only) so records stay picklable
+# and deep-copyable
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+_HF_API_KEY_ENV = "HUGGINGFACE_API_KEY"
+_HF_API_KEY_URL = "https://huggingface.co/settings/tokens"
+_OPENAI_API_KEY_ENV = "OPENAI_API_KEY"
+_OPENAI_API_KEY_URL = "https://platform.openai.com/api-keys"
+_OPENAI_TERMS_URL = "https://openai.com/policies/terms-of-use"
+
+_LANGS_EN = ("en",)
+_LANGS_EU = ("en", "es", "fr", "de", "it")
+_LANGS_COMMON = _LANGS_EU + ("pt", "ru", "ja", "ko", "zh")
+_LANGS_COMMON_AR_HI = _LANGS_COMMON + ("ar", "hi")
+_LANGS_LLAMA = _LANGS_EU + ("pt", "pl", "ru", "ja", "ko", "zh")
+
+
+_HF_INFERENCE_BASE = "https://api-inference.huggingface.co/models/"
+_OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+
+
+def _hf_ep(model_id: str, rate_limit: str) -> Dict[str, Any]:
+    """Endpoint kwargs for a HuggingFace Inference API model"""
+    return {
+        "url": _HF_INFERENCE_BASE + model_id,
+        "method": "POST",
+        "headers": _JSON_HEADERS,
+        "auth_required": True,
+        "rate_limit": rate_limit,
+    }
+
+
+def _oai_ep(rate_limit: str) -> Dict[str, Any]:
+    """Endpoint kwargs for the OpenAI chat completions API"""
+    return {
+        "url": _OPENAI_CHAT_URL,
+        "method": "POST",
+        "headers": _JSON_HEADERS,
+        "auth_required": True,
+        "rate_limit": rate_limit,
+    }
+
+
+# Registry tables hold the constructor arguments of each entry; ModelInfo
+# objects are only built when an entry is first looked up (see get_hf_model
+# and get_openai_model)
+
 # HuggingFace Models Registry
-HUGGINGFACE_MODELS: Dict[str, ModelInfo] = {
-    "meta-llama/Llama-2-7b-chat-hf": ModelInfo(
+_HF_RAW: Dict[str, Dict[str, Any]] = {
+    "meta-llama/Llama-2-7b-chat-hf": dict(
         model_id="meta-llama/Llama-2-7b-chat-hf",
         name="Llama 2 7B Chat",
         provider="huggingface",
         type=ModelType.CHAT,
         access_method=AccessMethod.BOTH,
         description="Meta's Llama 2 7B chat model optimized for dialogue use cases",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/meta-llama/Llama-2-7b-chat-hf",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="30 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("meta-llama/Llama-2-7b-chat-hf", "30 requests/minute (free tier)"),
         local_endpoint="meta-llama/Llama-2-7b-chat-hf",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=7,
             context_window=4096,
             architecture="Transformer",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.LLAMA2_COMMUNITY,
         license_url="https://ai.meta.com/llama/license/",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="30 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Conversational AI",
             "Customer support",
             "General Q&A",
             "Content generation"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Requires HuggingFace account approval for gated models",
             "Context window limited to 4K tokens",
             "May require GPU for local inference"
-        ],
+        ),
         paper_url="https://arxiv.org/abs/2307.09288",
         documentation_url="https://huggingface.co/meta-llama/Llama-2-7b-chat-hf",
         model_card_url="https://huggingface.co/meta-llama/Llama-2-7b-chat-hf",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "pl", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_LLAMA,
         max_output_tokens=4096,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "meta-llama/Llama-2-13b-chat-hf": ModelInfo(
+    "meta-llama/Llama-2-13b-chat-hf": dict(
         model_id="meta-llama/Llama-2-13b-chat-hf",
         name="Llama 2 13B Chat",
         provider="huggingface",
         type=ModelType.CHAT,
         access_method=AccessMethod.BOTH,
         description="Meta's Llama 2 13B chat model with improved capabilities",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/meta-llama/Llama-2-13b-chat-hf",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="20 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("meta-llama/Llama-2-13b-chat-hf", "20 requests/minute (free tier)"),
         local_endpoint="meta-llama/Llama-2-13b-chat-hf",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=13,
             context_window=4096,
             architecture="Transformer",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.LLAMA2_COMMUNITY,
         license_url="https://ai.meta.com/llama/license/",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="20 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Advanced conversational AI",
             "Complex reasoning tasks",
             "Multi-turn dialogues",
             "Technical Q&A"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Requires HuggingFace account approval",
             "Larger model size requires more GPU memory",
             "Slower inference than 7B model"
-        ],
+        ),
         paper_url="https://arxiv.org/abs/2307.09288",
         documentation_url="https://huggingface.co/meta-llama/Llama-2-13b-chat-hf",
         model_card_url="https://huggingface.co/meta-llama/Llama-2-13b-chat-hf",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "pl", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_LLAMA,
         max_output_tokens=4096,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "meta-llama/Meta-Llama-3-8B-Instruct": ModelInfo(
+    "meta-llama/Meta-Llama-3-8B-Instruct": dict(
         model_id="meta-llama/Meta-Llama-3-8B-Instruct",
         name="Llama 3 8B Instruct",
         provider="huggingface",
         type=ModelType.INSTRUCT,
         access_method=AccessMethod.BOTH,
         description="Meta's latest Llama 3 8B instruction-tuned model with improved performance",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/meta-llama/Meta-Llama-3-8B-Instruct",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="30 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("meta-llama/Meta-Llama-3-8B-Instruct", "30 requests/minute (free tier)"),
         local_endpoint="meta-llama/Meta-Llama-3-8B-Instruct",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=8,
             context_window=8192,
             architecture="Transformer",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.LLAMA3_COMMUNITY,
         license_url="https://llama.meta.com/llama3/license/",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="30 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Instruction following",
             "Code generation",
             "Reasoning tasks",
             "Multi-step problem solving"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Requires HuggingFace account approval",
             "Newer model, may have less community support"
-        ],
+        ),
         paper_url="https://ai.meta.com/blog/meta-llama-3/",
         documentation_url="https://huggingface.co/meta-llama/Meta-Llama-3-8B-Instruct",
         model_card_url="https://huggingface.co/meta-llama/Meta-Llama-3-8B-Instruct",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "pl", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_LLAMA,
         max_output_tokens=8192,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "mistralai/Mistral-7B-Instruct-v0.2": ModelInfo(
+    "mistralai/Mistral-7B-Instruct-v0.2": dict(
         model_id="mistralai/Mistral-7B-Instruct-v0.2",
         name="Mistral 7B Instruct v0.2",
         provider="huggingface",
         type=ModelType.INSTRUCT,
         access_method=AccessMethod.BOTH,
         description="Mistral AI's 7B instruction-tuned model optimized for following instructions",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/mistralai/Mistral-7B-Instruct-v0.2",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="30 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("mistralai/Mistral-7B-Instruct-v0.2", "30 requests/minute (free tier)"),
         local_endpoint="mistralai/Mistral-7B-Instruct-v0.2",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=7,
             context_window=8192,
             architecture="Transformer",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.APACHE_2,
         license_url="https://www.apache.org/licenses/LICENSE-2.0",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="30 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Instruction following",
             "Code generation",
             "Text summarization",
             "Question answering"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "May require GPU for optimal performance",
             "Context window limited to 8K tokens"
-        ],
+        ),
         paper_url="https://arxiv.org/abs/2310.06825",
         documentation_url="https://huggingface.co/mistralai/Mistral-7B-Instruct-v0.2",
         model_card_url="https://huggingface.co/mistralai/Mistral-7B-Instruct-v0.2",
-        supported_languages=["en", "es", "fr", "de", "it"],
+        supported_languages=_LANGS_EU,
         max_output_tokens=8192,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "microsoft/DialoGPT-large": ModelInfo(
+    "microsoft/DialoGPT-large": dict(
         model_id="microsoft/DialoGPT-large",
         name="DialoGPT Large",
         provider="huggingface",
         type=ModelType.CHAT,
         access_method=AccessMethod.BOTH,
         description="Microsoft's conversational AI model trained on Reddit dialogues",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/microsoft/DialoGPT-large",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="30 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("microsoft/DialoGPT-large", "30 requests/minute (free tier)"),
         local_endpoint="microsoft/DialoGPT-large",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=0.774,  # 774M parameters
             context_window=1024,
             architecture="GPT-2 based",
-            quantization=["fp16", "int8"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.MIT,
         license_url="https://opensource.org/licenses/MIT",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="30 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Casual conversation",
             "Chatbot applications",
             "Dialogue generation"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Smaller context window (1K tokens)",
             "May generate repetitive responses",
             "Trained on Reddit data, may have biases"
-        ],
+        ),
         paper_url="https://arxiv.org/abs/1911.00536",
         documentation_url="https://huggingface.co/microsoft/DialoGPT-large",
         model_card_url="https://huggingface.co/microsoft/DialoGPT-large",
-        supported_languages=["en"],
+        supported_languages=_LANGS_EN,
         max_output_tokens=1024,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "google/flan-t5-xxl": ModelInfo(
+    "google/flan-t5-xxl": dict(
         model_id="google/flan-t5-xxl",
         name="FLAN-T5 XXL",
         provider="huggingface",
         type=ModelType.INSTRUCT,
         access_method=AccessMethod.BOTH,
         description="Google's instruction-tuned T5 model with 11B parameters",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/google/flan-t5-xxl",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="20 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("google/flan-t5-xxl", "20 requests/minute (free tier)"),
         local_endpoint="google/flan-t5-xxl",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=11,
             context_window=512,
             architecture="T5 (Encoder-Decoder)",
-            quantization=["fp16", "int8"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.APACHE_2,
         license_url="https://www.apache.org/licenses/LICENSE-2.0",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="20 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Instruction following",
             "Text summarization",
             "Question answering",
             "Translation"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Smaller context window (512 tokens)",
             "Encoder-decoder architecture may be slower",
             "Requires significant GPU memory"
-        ],
+        ),
         paper_url="https://arxiv.org/abs/2210.11416",
         documentation_url="https://huggingface.co/google/flan-t5-xxl",
         model_card_url="https://huggingface.co/google/flan-t5-xxl",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja"],
+        supported_languages=("en", "es", "fr", "de", "it", "pt", "ru", "zh", "ja"),
         max_output_tokens=512,
         default_temperature=0.7,
         default_max_tokens=256
     ),
     
-    "HuggingFaceH4/zephyr-7b-beta": ModelInfo(
+    "HuggingFaceH4/zephyr-7b-beta": dict(
         model_id="HuggingFaceH4/zephyr-7b-beta",
         name="Zephyr 7B Beta",
         provider="huggingface",
         type=ModelType.INSTRUCT,
         access_method=AccessMethod.BOTH,
         description="HuggingFace's Zephyr instruction-tuned model based on Mistral 7B",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/HuggingFaceH4/zephyr-7b-beta",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="30 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("HuggingFaceH4/zephyr-7b-beta", "30 requests/minute (free tier)"),
         local_endpoint="HuggingFaceH4/zephyr-7b-beta",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=7,
             context_window=8192,
             architecture="Transformer",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.MIT,
         license_url="https://opensource.org/licenses/MIT",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="30 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Instruction following",
             "Helpful assistant tasks",
             "Conversational AI",
             "General purpose tasks"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Beta version, may have stability issues",
             "May require GPU for optimal performance"
-        ],
+        ),
         paper_url="https://huggingface.co/HuggingFaceH4/zephyr-7b-beta",
         documentation_url="https://huggingface.co/HuggingFaceH4/zephyr-7b-beta",
         model_card_url="https://huggingface.co/HuggingFaceH4/zephyr-7b-beta",
-        supported_languages=["en"],
+        supported_languages=_LANGS_EN,
         max_output_tokens=8192,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "mistralai/Mixtral-8x7B-Instruct-v0.1": ModelInfo(
+    "mistralai/Mixtral-8x7B-Instruct-v0.1": dict(
         model_id="mistralai/Mixtral-8x7B-Instruct-v0.1",
         name="Mixtral 8x7B Instruct",
         provider="huggingface",
         type=ModelType.INSTRUCT,
         access_method=AccessMethod.BOTH,
         description="Mistral AI's mixture of experts model with 8x7B parameters",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/mistralai/Mixtral-8x7B-Instruct-v0.1",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="10 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("mistralai/Mixtral-8x7B-Instruct-v0.1", "10 requests/minute (free tier)"),
         local_endpoint="mistralai/Mixtral-8x7B-Instruct-v0.1",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=47,  # 8x7B with sparse activation
             context_window=32768,
             architecture="Mixture of Experts (MoE)",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.APACHE_2,
         license_url="https://www.apache.org/licenses/LICENSE-2.0",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="10 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Complex reasoning",
             "Code generation",
             "Long context tasks",
             "Multi-step problem solving"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Requires significant GPU memory",
             "Slower inference than single-expert models",
             "Higher API rate limits"
-        ],
+        ),
         paper_url="https://arxiv.org/abs/2401.04088",
         documentation_url="https://huggingface.co/mistralai/Mixtral-8x7B-Instruct-v0.1",
         model_card_url="https://huggingface.co/mistralai/Mixtral-8x7B-Instruct-v0.1",
-        supported_languages=["en", "es", "fr", "de", "it"],
+        supported_languages=_LANGS_EU,
         max_output_tokens=32768,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "Qwen/Qwen2.5-7B-Instruct": ModelInfo(
+    "Qwen/Qwen2.5-7B-Instruct": dict(
         model_id="Qwen/Qwen2.5-7B-Instruct",
         name="Qwen 2.5 7B Instruct",
         provider="huggingface",
         type=ModelType.INSTRUCT,
         access_method=AccessMethod.BOTH,
         description="Alibaba's Qwen 2.5 7B instruction-tuned model with strong multilingual support",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/Qwen/Qwen2.5-7B-Instruct",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="30 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("Qwen/Qwen2.5-7B-Instruct", "30 requests/minute (free tier)"),
         local_endpoint="Qwen/Qwen2.5-7B-Instruct",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=7,
             context_window=32768,
             architecture="Transformer",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.APACHE_2,
         license_url="https://www.apache.org/licenses/LICENSE-2.0",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="30 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Multilingual tasks",
             "Code generation",
             "Reasoning tasks",
             "Long context processing"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "May require GPU for optimal performance",
             "Newer model, less community support"
-        ],
+        ),
         paper_url="https://qwenlm.github.io/blog/qwen2.5/",
         documentation_url="https://huggingface.co/Qwen/Qwen2.5-7B-Instruct",
         model_card_url="https://huggingface.co/Qwen/Qwen2.5-7B-Instruct",
-        supported_languages=["en", "zh", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "ar", "hi"],
+        supported_languages=("en", "zh", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "ar", "hi"),
         max_output_tokens=32768,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "google/gemma-7b-it": ModelInfo(
+    "google/gemma-7b-it": dict(
         model_id="google/gemma-7b-it",
         name="Gemma 7B Instruct",
         provider="huggingface",
         type=ModelType.INSTRUCT,
         access_method=AccessMethod.BOTH,
         description="Google's Gemma 7B instruction-tuned model based on Gemini technology",
-        api_endpoint=ModelEndpoint(
-            url="https://api-inference.huggingface.co/models/google/gemma-7b-it",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="30 requests/minute (free tier)"
-        ),
+        api_endpoint=_hf_ep("google/gemma-7b-it", "30 requests/minute (free tier)"),
         local_endpoint="google/gemma-7b-it",
-        specs=ModelSpecs(
+        specs=dict(
             parameters=7,
             context_window=8192,
             architecture="Transformer",
-            quantization=["fp16", "int8", "int4"],
-            precision=["fp32", "fp16"]
+            quantization=("fp16", "int8", "int4"),
+            precision=("fp32", "fp16")
         ),
         license=LicenseType.CUSTOM,
         license_url="https://ai.google.dev/gemma/terms",
         api_key_required=True,
-        api_key_env_var="HUGGINGFACE_API_KEY",
-        api_key_url="https://huggingface.co/settings/tokens",
+        api_key_env_var=_HF_API_KEY_ENV,
+        api_key_url=_HF_API_KEY_URL,
         free_tier_available=True,
         free_tier_limits="30 requests/minute",
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Instruction following",
             "Text generation",
             "Question answering",
             "Code generation"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Custom license terms apply",
             "May require GPU for optimal performance"
-        ],
+        ),
         paper_url="https://ai.google.dev/gemma",
         documentation_url="https://huggingface.co/google/gemma-7b-it",
         model_card_url="https://huggingface.co/google/gemma-7b-it",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_COMMON,
         max_output_tokens=8192,
         default_temperature=0.7,
         default_max_tokens=512
@@ -595,411 +661,700 @@ HUGGINGFACE_MODELS: Dict[str, ModelInfo] = {
 
 
 # OpenAI Models Registry
-OPENAI_MODELS: Dict[str, ModelInfo] = {
-    "gpt-4": ModelInfo(
+_OPENAI_RAW: Dict[str, Dict[str, Any]] = {
+    "gpt-4": dict(
         model_id="gpt-4",
         name="GPT-4",
         provider="openai",
         type=ModelType.CHAT,
         access_method=AccessMethod.API,
         description="OpenAI's most capable model with advanced reasoning capabilities",
-        api_endpoint=ModelEndpoint(
-            url="https://api.openai.com/v1/chat/completions",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="Varies by tier (500-10,000 requests/minute)"
-        ),
-        specs=ModelSpecs(
+        api_endpoint=_oai_ep("Varies by tier (500-10,000 requests/minute)"),
+        specs=dict(
             parameters=None,  # Not publicly disclosed
             context_window=8192,
             architecture="Transformer (proprietary)",
-            precision=["fp16"]
+            precision=("fp16",)
         ),
         license=LicenseType.PROPRIETARY,
-        license_url="https://openai.com/policies/terms-of-use",
+        license_url=_OPENAI_TERMS_URL,
         api_key_required=True,
-        api_key_env_var="OPENAI_API_KEY",
-        api_key_url="https://platform.openai.com/api-keys",
+        api_key_env_var=_OPENAI_API_KEY_ENV,
+        api_key_url=_OPENAI_API_KEY_URL,
         cost_per_1k_tokens=0.03,  # Approximate for input tokens
         free_tier_available=False,
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Complex reasoning",
             "Code generation",
             "Creative writing",
             "Analysis and synthesis",
             "Advanced Q&A"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Proprietary model, no local access",
             "Requires paid API access",
             "Rate limits apply",
             "Context window limited to 8K tokens"
-        ],
+        ),
         documentation_url="https://platform.openai.com/docs/models/gpt-4",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh", "ar", "hi"],
+        supported_languages=_LANGS_COMMON_AR_HI,
         max_output_tokens=8192,
         default_temperature=0.7,
         default_max_tokens=512
     ),
     
-    "gpt-4-turbo": ModelInfo(
+    "gpt-4-turbo": dict(
         model_id="gpt-4-turbo",
         name="GPT-4 Turbo",
         provider="openai",
         type=ModelType.CHAT,
         access_method=AccessMethod.API,
         description="Faster and more capable GPT-4 variant with extended context window",
-        api_endpoint=ModelEndpoint(
-            url="https://api.openai.com/v1/chat/completions",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="Varies by tier (500-10,000 requests/minute)"
-        ),
-        specs=ModelSpecs(
+        api_endpoint=_oai_ep("Varies by tier (500-10,000 requests/minute)"),
+        specs=dict(
             parameters=None,
             context_window=128000,
             architecture="Transformer (proprietary)",
-            precision=["fp16"]
+            precision=("fp16",)
         ),
         license=LicenseType.PROPRIETARY,
-        license_url="https://openai.com/policies/terms-of-use",
+        license_url=_OPENAI_TERMS_URL,
         api_key_required=True,
-        api_key_env_var="OPENAI_API_KEY",
-        api_key_url="https://platform.openai.com/api-keys",
+        api_key_env_var=_OPENAI_API_KEY_ENV,
+        api_key_url=_OPENAI_API_KEY_URL,
         cost_per_1k_tokens=0.01,  # Approximate for input tokens
         free_tier_available=False,
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Long context processing",
             "Document analysis",
             "Code generation",
             "Complex reasoning",
             "Multimodal tasks"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Proprietary model",
             "Requires paid API access",
             "Higher cost than GPT-3.5"
-        ],
+        ),
         documentation_url="https://platform.openai.com/docs/models/gpt-4-turbo",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh", "ar", "hi"],
+        supported_languages=_LANGS_COMMON_AR_HI,
         max_output_tokens=16384,
         default_temperature=0.7,
         default_max_tokens=4096
     ),
     
-    "gpt-4-turbo-preview": ModelInfo(
+    "gpt-4-turbo-preview": dict(
         model_id="gpt-4-turbo-preview",
         name="GPT-4 Turbo Preview",
         provider="openai",
         type=ModelType.CHAT,
         access_method=AccessMethod.API,
         description="Preview version of GPT-4 Turbo with latest improvements",
-        api_endpoint=ModelEndpoint(
-            url="https://api.openai.com/v1/chat/completions",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="Varies by tier"
-        ),
-        specs=ModelSpecs(
+        api_endpoint=_oai_ep("Varies by tier"),
+        specs=dict(
             parameters=None,
             context_window=128000,
             architecture="Transformer (proprietary)",
-            precision=["fp16"]
+            precision=("fp16",)
         ),
         license=LicenseType.PROPRIETARY,
-        license_url="https://openai.com/policies/terms-of-use",
+        license_url=_OPENAI_TERMS_URL,
         api_key_required=True,
-        api_key_env_var="OPENAI_API_KEY",
-        api_key_url="https://platform.openai.com/api-keys",
+        api_key_env_var=_OPENAI_API_KEY_ENV,
+        api_key_url=_OPENAI_API_KEY_URL,
         cost_per_1k_tokens=0.01,
         free_tier_available=False,
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Testing new features",
             "Long context tasks",
             "Advanced reasoning"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Preview version, may change",
             "Proprietary model",
             "Requires paid access"
-        ],
+        ),
         documentation_url="https://platform.openai.com/docs/models/gpt-4-turbo",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_COMMON,
         max_output_tokens=16384,
         default_temperature=0.7,
         default_max_tokens=4096
     ),
     
-    "gpt-3.5-turbo": ModelInfo(
+    "gpt-3.5-turbo": dict(
         model_id="gpt-3.5-turbo",
         name="GPT-3.5 Turbo",
         provider="openai",
         type=ModelType.CHAT,
         access_method=AccessMethod.API,
         description="Fast and efficient GPT-3.5 model optimized for speed and cost",
-        api_endpoint=ModelEndpoint(
-            url="https://api.openai.com/v1/chat/completions",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="Varies by tier (3,500-10,000 requests/minute)"
-        ),
-        specs=ModelSpecs(
+        api_endpoint=_oai_ep("Varies by tier (3,500-10,000 requests/minute)"),
+        specs=dict(
             parameters=None,
             context_window=16385,
             architecture="Transformer (proprietary)",
-            precision=["fp16"]
+            precision=("fp16",)
         ),
         license=LicenseType.PROPRIETARY,
-        license_url="https://openai.com/policies/terms-of-use",
+        license_url=_OPENAI_TERMS_URL,
         api_key_required=True,
-        api_key_env_var="OPENAI_API_KEY",
-        api_key_url="https://platform.openai.com/api-keys",
+        api_key_env_var=_OPENAI_API_KEY_ENV,
+        api_key_url=_OPENAI_API_KEY_URL,
         cost_per_1k_tokens=0.0005,  # Approximate for input tokens
         free_tier_available=False,
-        recommended_use_cases=[
+        recommended_use_cases=(
             "General purpose chat",
             "Quick responses",
             "Cost-effective applications",
             "High-volume tasks"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Proprietary model",
             "Requires paid API access",
             "Less capable than GPT-4"
-        ],
+        ),
         documentation_url="https://platform.openai.com/docs/models/gpt-3-5-turbo",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_COMMON,
         max_output_tokens=16385,
         default_temperature=0.7,
         default_max_tokens=4096
     ),
     
-    "gpt-3.5-turbo-16k": ModelInfo(
+    "gpt-3.5-turbo-16k": dict(
         model_id="gpt-3.5-turbo-16k",
         name="GPT-3.5 Turbo 16K",
         provider="openai",
         type=ModelType.CHAT,
         access_method=AccessMethod.API,
         description="GPT-3.5 Turbo with extended 16K context window",
-        api_endpoint=ModelEndpoint(
-            url="https://api.openai.com/v1/chat/completions",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="Varies by tier"
-        ),
-        specs=ModelSpecs(
+        api_endpoint=_oai_ep("Varies by tier"),
+        specs=dict(
             parameters=None,
             context_window=16385,
             architecture="Transformer (proprietary)",
-            precision=["fp16"]
+            precision=("fp16",)
         ),
         license=LicenseType.PROPRIETARY,
-        license_url="https://openai.com/policies/terms-of-use",
+        license_url=_OPENAI_TERMS_URL,
         api_key_required=True,
-        api_key_env_var="OPENAI_API_KEY",
-        api_key_url="https://platform.openai.com/api-keys",
+        api_key_env_var=_OPENAI_API_KEY_ENV,
+        api_key_url=_OPENAI_API_KEY_URL,
         cost_per_1k_tokens=0.003,  # Approximate for input tokens
         free_tier_available=False,
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Long documents",
             "Extended conversations",
             "Context-heavy tasks"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Proprietary model",
             "Requires paid access",
             "Higher cost than standard GPT-3.5"
-        ],
+        ),
         documentation_url="https://platform.openai.com/docs/models/gpt-3-5-turbo",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_COMMON,
         max_output_tokens=16385,
         default_temperature=0.7,
         default_max_tokens=4096
     ),
     
-    "gpt-4o": ModelInfo(
+    "gpt-4o": dict(
         model_id="gpt-4o",
         name="GPT-4o",
         provider="openai",
         type=ModelType.MULTIMODAL,
         access_method=AccessMethod.API,
         description="OpenAI's latest multimodal model optimized for speed and cost",
-        api_endpoint=ModelEndpoint(
-            url="https://api.openai.com/v1/chat/completions",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="Varies by tier"
-        ),
-        specs=ModelSpecs(
+        api_endpoint=_oai_ep("Varies by tier"),
+        specs=dict(
             parameters=None,
             context_window=128000,
             architecture="Transformer (proprietary)",
-            precision=["fp16"]
+            precision=("fp16",)
         ),
         license=LicenseType.PROPRIETARY,
-        license_url="https://openai.com/policies/terms-of-use",
+        license_url=_OPENAI_TERMS_URL,
         api_key_required=True,
-        api_key_env_var="OPENAI_API_KEY",
-        api_key_url="https://platform.openai.com/api-keys",
+        api_key_env_var=_OPENAI_API_KEY_ENV,
+        api_key_url=_OPENAI_API_KEY_URL,
         cost_per_1k_tokens=0.005,  # Approximate for input tokens
         free_tier_available=False,
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Multimodal tasks",
             "Vision and text",
             "Fast responses",
             "Cost-effective advanced tasks"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Proprietary model",
             "Requires paid access",
             "Newer model, may have less documentation"
-        ],
+        ),
         documentation_url="https://platform.openai.com/docs/models/gpt-4o",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh", "ar", "hi"],
+        supported_languages=_LANGS_COMMON_AR_HI,
         max_output_tokens=16384,
         default_temperature=0.7,
         default_max_tokens=4096
     ),
     
-    "gpt-4o-mini": ModelInfo(
+    "gpt-4o-mini": dict(
         model_id="gpt-4o-mini",
         name="GPT-4o Mini",
         provider="openai",
         type=ModelType.MULTIMODAL,
         access_method=AccessMethod.API,
         description="Smaller, faster, and more affordable version of GPT-4o",
-        api_endpoint=ModelEndpoint(
-            url="https://api.openai.com/v1/chat/completions",
-            method="POST",
-            headers={"Content-Type": "application/json"},
-            auth_required=True,
-            rate_limit="Varies by tier"
-        ),
-        specs=ModelSpecs(
+        api_endpoint=_oai_ep("Varies by tier"),
+        specs=dict(
             parameters=None,
             context_window=128000,
             architecture="Transformer (proprietary)",
-            precision=["fp16"]
+            precision=("fp16",)
         ),
         license=LicenseType.PROPRIETARY,
-        license_url="https://openai.com/policies/terms-of-use",
+        license_url=_OPENAI_TERMS_URL,
         api_key_required=True,
-        api_key_env_var="OPENAI_API_KEY",
-        api_key_url="https://platform.openai.com/api-keys",
+        api_key_env_var=_OPENAI_API_KEY_ENV,
+        api_key_url=_OPENAI_API_KEY_URL,
         cost_per_1k_tokens=0.00015,  # Approximate for input tokens
         free_tier_available=False,
-        recommended_use_cases=[
+        recommended_use_cases=(
             "Cost-effective multimodal tasks",
             "High-volume applications",
             "Quick responses",
             "General purpose chat"
-        ],
-        limitations=[
+        ),
+        limitations=(
             "Proprietary model",
             "Requires paid access",
             "Less capable than GPT-4o"
-        ],
+        ),
         documentation_url="https://platform.openai.com/docs/models/gpt-4o-mini",
-        supported_languages=["en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"],
+        supported_languages=_LANGS_COMMON,
         max_output_tokens=16384,
         default_temperature=0.7,
         default_max_tokens=4096
     ),
 }
 
+# Model IDs contain '/' and '-', so the compiler does not intern them;
+# interning the keys (which are also the model_id field objects) lets
+# lookups with registry-provided IDs match by identity
+_HF_RAW = {sys.intern(model_id): raw for model_id, raw in _HF_RAW.items()}
+_OPENAI_RAW = {sys.intern(model_id): raw for model_id, raw in _OPENAI_RAW.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_specs(
+    parameters: Optional[int] = None,
+    context_window: Optional[int] = None,
+    architecture: Optional[str] = None,
+    quantization: Optional[Tuple[str, ...]] = None,
+    precision: Optional[Tuple[str, ...]] = None,
+) -> ModelSpecs:
+    """Flyweight ModelSpecs: entries with identical specs share one object"""
+    return ModelSpecs(
+        parameters=parameters,
+        context_window=context_window,
+        architecture=architecture,
+        quantization=quantization,
+        precision=precision,
+    )
+
+
+def _build_model(raw: Dict[str, Any]) -> ModelInfo:
+    """Build a ModelInfo from its registry table entry"""
+    kwargs = dict(raw)
+    endpoint = kwargs.get("api_endpoint")
+    if endpoint is not None:
+        kwargs["api_endpoint"] = ModelEndpoint(**endpoint)
+    specs = kwargs.get("specs")
+    if specs is not None:
+        kwargs["specs"] = _shared_specs(**specs)
+    return ModelInfo(**kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def get_hf_model(model_id: str) -> ModelInfo:
+    """Get a HuggingFace model, building it on first access (KeyError if unknown)"""
+    return _build_model(_HF_RAW[model_id])
+
+
+@functools.lru_cache(maxsize=None)
+def get_openai_model(model_id: str) -> ModelInfo:
+    """Get an OpenAI model, building it on first access (KeyError if unknown)"""
+    return _build_model(_OPENAI_RAW[model_id])
+
+
+def iter_hf_models() -> Iterator[ModelInfo]:
+    """Iterate over all HuggingFace models"""
+    return map(get_hf_model, _HF_RAW)
+
+
+def iter_openai_models() -> Iterator[ModelInfo]:
+    """Iterate over all OpenAI models"""
+    return map(get_openai_model, _OPENAI_RAW)
+
+
+class _LazyRegistry(Mapping[str, ModelInfo]):
+    """Read-only model_id -> ModelInfo mapping that builds entries on access"""
+
+    __slots__ = ("_ids", "_load")
+
+    def __init__(self, ids: Mapping[str, Any], load: Callable[[str], ModelInfo]):
+        self._ids = ids
+        self._load = load
+
+    def __getitem__(self, model_id: str) -> ModelInfo:
+        if model_id not in self._ids:
+            raise KeyError(model_id)
+        return self._load(model_id)
+
+    def get(self, model_id: str, default: Any = None) -> Any:
+        # Mapping.get would go through __getitem__ and a KeyError
+        if model_id in self._ids:
+            return self._load(model_id)
+        return default
+
+    def __contains__(self, model_id: object) -> bool:
+        return model_id in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._ids)!r})"
+
+
+def _load_any(model_id: str) -> ModelInfo:
+    if model_id in _OPENAI_RAW:
+        return get_openai_model(model_id)
+    return get_hf_model(model_id)
+
+
+HUGGINGFACE_MODELS: Mapping[str, ModelInfo] = _LazyRegistry(_HF_RAW, get_hf_model)
+OPENAI_MODELS: Mapping[str, ModelInfo] = _LazyRegistry(_OPENAI_RAW, get_openai_model)
 
 # Combined registry
-ALL_MODELS: Dict[str, ModelInfo] = {**HUGGINGFACE_MODELS, **OPENAI_MODELS}
+ALL_MODELS: Mapping[str, ModelInfo] = _LazyRegistry({**_HF_RAW, **_OPENAI_RAW}, _load_any)
+
+_ITEM_REGISTRIES: Dict[str, Mapping[str, ModelInfo]] = {
+    "HF_ITEMS": HUGGINGFACE_MODELS,
+    "OPENAI_ITEMS": OPENAI_MODELS,
+    "ALL_ITEMS": ALL_MODELS,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _registry_items(name: str) -> Tuple[Tuple[str, ModelInfo], ...]:
+    registry = _ITEM_REGISTRIES[name]
+    return tuple((model_id, registry[model_id]) for model_id in registry)
+
+
+def __getattr__(name: str) -> Any:
+    # HF_ITEMS, OPENAI_ITEMS and ALL_ITEMS are (model_id, ModelInfo) tuples in
+    # registry order. They are resolved on first access so importing the
+    # module still builds no entries.
+    if name in _ITEM_REGISTRIES:
+        return _registry_items(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _all_raw() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    yield from _HF_RAW.items()
+    yield from _OPENAI_RAW.items()
+
+
+# Inverted indices over the registry tables, each computed on first query.
+# They return tuples of model IDs so cached results cannot be mutated.
+
+@functools.lru_cache(maxsize=None)
+def by_provider(provider: str) -> Tuple[str, ...]:
+    """IDs of all models from a provider"""
+    provider = provider.lower()
+    return tuple(mid for mid, raw in _all_raw() if raw["provider"] == provider)
+
+
+@functools.lru_cache(maxsize=None)
+def by_type(model_type: ModelType) -> Tuple[str, ...]:
+    """IDs of all models of a type"""
+    return tuple(mid for mid, raw in _all_raw() if raw["type"] == model_type)
+
+
+@functools.lru_cache(maxsize=None)
+def by_license(license_type: LicenseType) -> Tuple[str, ...]:
+    """IDs of all models under a license"""
+    return tuple(mid for mid, raw in _all_raw() if raw.get("license") == license_type)
+
+
+@functools.lru_cache(maxsize=None)
+def by_env_var(env_var: str) -> Tuple[str, ...]:
+    """IDs of all models whose API key is read from ``env_var``"""
+    return tuple(mid for mid, raw in _all_raw() if raw.get("api_key_env_var") == env_var)
+
+
+def invalidate() -> None:
+    """Drop every cached registry query; call after changing the registry tables"""
+    for cached in (
+        by_provider, by_type, by_license, by_env_var, _filter_columns, _registry_items,
+        _search_index, _export_dict, _provider_bucket, _type_bucket, _free_bucket,
+        _local_bucket,
+    ):
+        cached.cache_clear()
 
 
 def get_model_info(model_id: str) -> Optional[ModelInfo]:
     """Get model information by model ID"""
-    return ALL_MODELS.get(model_id)
+    if model_id in _OPENAI_RAW:
+        return get_openai_model(model_id)
+    if model_id in _HF_RAW:
+        return get_hf_model(model_id)
+    return None
+
+
+# Enum members are resolved once here: each ``AccessMethod.X`` lookup costs
+# several times more than the comparison, and tuple membership matches
+# members by identity first
+_LOCAL_ACCESS = (AccessMethod.LOCAL, AccessMethod.BOTH)
+
+
+# Result buckets for the list/get helpers below, filled on first call. The
+# helpers hand out list copies so callers cannot alter the cached buckets.
+
+@functools.lru_cache(maxsize=None)
+def _provider_bucket(provider: str) -> Tuple[ModelInfo, ...]:
+    return tuple(ALL_MODELS[model_id] for model_id in by_provider(provider))
+
+
+@functools.lru_cache(maxsize=None)
+def _type_bucket(model_type: ModelType) -> Tuple[ModelInfo, ...]:
+    return tuple(ALL_MODELS[model_id] for model_id in by_type(model_type))
+
+
+@functools.lru_cache(maxsize=1)
+def _free_bucket() -> Tuple[ModelInfo, ...]:
+    return tuple(model for _, model in _registry_items("ALL_ITEMS") if model.free_tier_available)
+
+
+@functools.lru_cache(maxsize=1)
+def _local_bucket() -> Tuple[ModelInfo, ...]:
+    return tuple(model for _, model in _registry_items("ALL_ITEMS")
+                 if model.access_method in _LOCAL_ACCESS)
 
 
 def list_models_by_provider(provider: str) -> List[ModelInfo]:
     """List all models for a specific provider"""
-    if provider.lower() == "huggingface":
-        return list(HUGGINGFACE_MODELS.values())
-    elif provider.lower() == "openai":
-        return list(OPENAI_MODELS.values())
-    else:
-        return []
+    return list(_provider_bucket(provider))
 
 
 def list_models_by_type(model_type: ModelType) -> List[ModelInfo]:
     """List all models of a specific type"""
-    return [model for model in ALL_MODELS.values() if model.type == model_type]
+    return list(_type_bucket(model_type))
+
+
+_GRAM = 3
+# Joins a model's searchable fields into one blob; lowercased registry text
+# never contains it, so a query without it cannot match across two fields
+_FIELD_SEP = "\0"
+# Posting for a trigram no model contains
+_NO_POSTING: AbstractSet[int] = frozenset()
+
+
+def _grams(text: str) -> Set[str]:
+    return {text[i:i + _GRAM] for i in range(len(text) - _GRAM + 1)}
+
+
+@functools.lru_cache(maxsize=1)
+def _search_index() -> Tuple[
+    Dict[str, Set[int]], Tuple[Tuple[str, ...], ...], Tuple[str, ...]
+]:
+    """
+    Trigram index over the searchable fields, built on first search.
+
+    Returns ``(postings, fields, blobs)``: ``postings`` maps each trigram to
+    the positions (in ALL_ITEMS order) of models with a field containing it,
+    ``fields[i]`` holds the lowercased name, description and use cases of
+    the model at position ``i`` and ``blobs[i]`` is those fields joined by
+    _FIELD_SEP. Trigrams never span two fields.
+    """
+    postings: Dict[str, Set[int]] = {}
+    fields = []
+    for position, (_, raw) in enumerate(_all_raw()):
+        texts = (
+            raw["name"].lower(),
+            raw["description"].lower(),
+            *(use_case.lower() for use_case in raw.get("recommended_use_cases", ())),
+        )
+        fields.append(texts)
+        for text in texts:
+            for gram in _grams(text):
+                postings.setdefault(gram, set()).add(position)
+    return postings, tuple(fields), tuple(_FIELD_SEP.join(texts) for texts in fields)
 
 
 def search_models(query: str) -> List[ModelInfo]:
     """Search models by name, description, or use case"""
     query_lower = query.lower()
-    results = []
-    for model in ALL_MODELS.values():
-        if (query_lower in model.name.lower() or
-            query_lower in model.description.lower() or
-            any(query_lower in use_case.lower() for use_case in model.recommended_use_cases)):
-            results.append(model)
-    return results
+    postings, fields, blobs = _search_index()
+
+    candidates: Sequence[int]
+    if len(query_lower) < _GRAM:
+        candidates = range(len(fields))
+    else:
+        # Every trigram of the query must occur in the model; intersecting
+        # the smallest postings first keeps the working set small
+        sets = sorted((postings.get(gram, _NO_POSTING) for gram in _grams(query_lower)),
+                      key=len)
+        if not sets[0]:
+            return []
+        matched = set(sets[0])
+        for posting in sets[1:]:
+            matched &= posting
+            if not matched:
+                return []
+        candidates = sorted(matched)
+
+    # Trigrams only narrow the candidates; confirm the substring with one
+    # containment test on the blob, or per field for queries holding the
+    # separator
+    items = _registry_items("ALL_ITEMS")
+    if _FIELD_SEP not in query_lower:
+        return [items[position][1] for position in candidates
+                if query_lower in blobs[position]]
+    return [
+        items[position][1]
+        for position in candidates
+        if any(query_lower in text for text in fields[position])
+    ]
 
 
 def get_free_models() -> List[ModelInfo]:
     """Get all models with free tier available"""
-    return [model for model in ALL_MODELS.values() if model.free_tier_available]
+    return list(_free_bucket())
 
 
 def get_local_models() -> List[ModelInfo]:
     """Get all models that can be run locally"""
-    return [model for model in ALL_MODELS.values() 
-            if model.access_method in [AccessMethod.LOCAL, AccessMethod.BOTH]]
+    return list(_local_bucket())
+
+
+_MODEL_TYPE_CODES: Dict[ModelType, int] = {t: i for i, t in enumerate(ModelType)}
+
+
+@functools.lru_cache(maxsize=1)
+def _filter_columns() -> Dict[str, Any]:
+    """
+    Column-wise copy of the fields filter_models() tests, read straight from
+    the registry tables so no ModelInfo has to be built. The registry is
+    small enough that a Python scan over tuples beats importing numpy.
+    """
+    ids = tuple(_HF_RAW) + tuple(_OPENAI_RAW)
+    raws = [*_HF_RAW.values(), *_OPENAI_RAW.values()]
+    providers = sorted({raw["provider"] for raw in raws})
+    provider_codes = {provider: i for i, provider in enumerate(providers)}
+
+    return {
+        "ids": ids,
+        "provider_codes": provider_codes,
+        "context_window": tuple(
+            (raw.get("specs") or {}).get("context_window") or 0 for raw in raws
+        ),
+        "provider": tuple(provider_codes[raw["provider"]] for raw in raws),
+        "type": tuple(_MODEL_TYPE_CODES[raw["type"]] for raw in raws),
+    }
+
+
+def filter_models(
+    min_context: int = 0,
+    provider: Optional[str] = None,
+    model_type: Optional[ModelType] = None,
+) -> List[str]:
+    """
+    Get the IDs of models matching all of the given criteria
+
+    Args:
+        min_context: Minimum context window in tokens (models without a
+            known context window only match when this is 0)
+        provider: Provider name ('huggingface' or 'openai')
+        model_type: Model type
+
+    Returns:
+        Matching model IDs in registry order
+    """
+    columns = _filter_columns()
+    provider_code = -1
+    if provider is not None:
+        provider_code = columns["provider_codes"].get(provider.lower())
+        if provider_code is None:
+            return []
+    type_code = -1 if model_type is None else _MODEL_TYPE_CODES[ModelType(model_type)]
+    return [
+        model_id
+        for model_id, context, prov, typ in zip(
+            columns["ids"], columns["context_window"], columns["provider"], columns["type"]
+        )
+        if context >= min_context
+        and (provider_code < 0 or prov == provider_code)
+        and (type_code < 0 or typ == type_code)
+    ]
 
 
 def export_to_dict() -> Dict[str, Dict[str, Any]]:
-    """Export all models to a dictionary format"""
-    result = {}
-    for model_id, model_info in ALL_MODELS.items():
-        result[model_id] = {
-            "model_id": model_info.model_id,
-            "name": model_info.name,
-            "provider": model_info.provider,
-            "type": model_info.type.value,
-            "access_method": model_info.access_method.value,
-            "description": model_info.description,
-            "api_endpoint": {
-                "url": model_info.api_endpoint.url if model_info.api_endpoint else None,
-                "method": model_info.api_endpoint.method if model_info.api_endpoint else None,
-                "auth_required": model_info.api_endpoint.auth_required if model_info.api_endpoint else None,
-                "rate_limit": model_info.api_endpoint.rate_limit if model_info.api_endpoint else None,
-            } if model_info.api_endpoint else None,
-            "local_endpoint": model_info.local_endpoint,
-            "specs": {
-                "parameters": model_info.specs.parameters if model_info.specs else None,
-                "context_window": model_info.specs.context_window if model_info.specs else None,
-                "architecture": model_info.specs.architecture if model_info.specs else None,
-            } if model_info.specs else None,
-            "license": model_info.license.value if model_info.license else None,
-            "license_url": model_info.license_url,
-            "api_key_required": model_info.api_key_required,
-            "api_key_env_var": model_info.api_key_env_var,
-            "api_key_url": model_info.api_key_url,
-            "cost_per_1k_tokens": model_info.cost_per_1k_tokens,
-            "free_tier_available": model_info.free_tier_available,
-            "free_tier_limits": model_info.free_tier_limits,
-            "recommended_use_cases": model_info.recommended_use_cases,
-            "limitations": model_info.limitations,
-            "documentation_url": model_info.documentation_url,
-            "model_card_url": model_info.model_card_url,
-            "supported_languages": model_info.supported_languages,
-            "max_output_tokens": model_info.max_output_tokens,
-            "default_temperature": model_info.default_temperature,
-            "default_max_tokens": model_info.default_max_tokens,
-        }
-    return result
+    """
+    Export all models to a dictionary format
+
+    The export is built once; every call returns a deep copy of it, so
+    callers may modify the result without affecting later calls.
+    """
+    return copy.deepcopy(_export_dict())
+
+
+@functools.lru_cache(maxsize=1)
+def _export_dict() -> Dict[str, Dict[str, Any]]:
+    return {model_id: _export_model(model_info)
+            for model_id, model_info in _registry_items("ALL_ITEMS")}
+
 
+def _export_model(model_info: ModelInfo) -> Dict[str, Any]:
+    endpoint = model_info.api_endpoint
+    specs = model_info.specs
+    license_type = model_info.license
+    return {
+        "model_id": model_info.model_id,
+        "name": model_info.name,
+        "provider": model_info.provider,
+        "type": model_info.type.value,
+        "access_method": model_info.access_method.value,
+        "description": model_info.description,
+        "api_endpoint": {
+            "url": endpoint.url,
+            "method": endpoint.method,
+            "auth_required": endpoint.auth_required,
+            "rate_limit": endpoint.rate_limit,
+        } if endpoint else None,
+        "local_endpoint": model_info.local_endpoint,
+        "specs": {
+            "parameters": specs.parameters,
+            "context_window": specs.context_window,
+            "architecture": specs.architecture,
+        } if specs else None,
+        "license": license_type.value if license_type else None,
+        "license_url": model_info.license_url,
+        "api_key_required": model_info.api_key_required,
+        "api_key_env_var": model_info.api_key_env_var,
+        "api_key_url": model_info.api_key_url,
+        "cost_per_1k_tokens": model_info.cost_per_1k_tokens,
+        "free_tier_available": model_info.free_tier_available,
+        "free_tier_limits": model_info.free_tier_limits,
+        "recommended_use_cases": list(model_info.recommended_use_cases),
+        "limitations": list(model_info.limitations),
+        "documentation_url": model_info.documentation_url,
+        "model_card_url": model_info.model_card_url,
+        "supported_languages": list(model_info.supported_languages),
+        "max_output_tokens": model_info.max_output_tokens,
+        "default_temperature": model_info.default_temperature,
+        "default_max_tokens": model_info.default_max_tokens,
+    }
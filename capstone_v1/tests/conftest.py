@@ -3,7 +3,6 @@ Pytest configuration and fixtures
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock
 from typing import Dict, Any
 
 from api_wrapper import ChatbotWrapper
@@ -37,6 +36,37 @@ def mock_huggingface_response():
     }
 
 
+# The models registry is read-only, so its query results are shared by the
+# whole session
+
+@pytest.fixture(scope="session")
+def free_models():
+    """Models with a free tier"""
+    from models.models_registry import get_free_models
+    return get_free_models()
+
+
+@pytest.fixture(scope="session")
+def local_models():
+    """Models that can run locally"""
+    from models.models_registry import get_local_models
+    return get_local_models()
+
+
+@pytest.fixture(scope="session")
+def huggingface_models():
+    """HuggingFace models from the registry"""
+    from models.models_registry import list_models_by_provider
+    return list_models_by_provider("huggingface")
+
+
+@pytest.fixture(scope="session")
+def openai_models():
+    """OpenAI models from the registry"""
+    from models.models_registry import list_models_by_provider
+    return list_models_by_provider("openai")
+
+
 @pytest.fixture
 def chatbot_wrapper():
     """Create a ChatbotWrapper instance for testing"""
@@ -46,18 +76,29 @@ def chatbot_wrapper():
     )
 
 
-@pytest.fixture
-def mock_openai_client(monkeypatch):
-    """Mock OpenAI client"""
-    mock_client = MagicMock()
-    monkeypatch.setattr("api_wrapper.openai_client.OpenAIClient", lambda *args, **kwargs: mock_client)
-    return mock_client
+class _StubClient:
+    """Minimal stand-in for a provider client; chat() returns a canned response"""
+
+    def __init__(self, response: Dict[str, Any]):
+        self._resp = response
+        self.calls = []
+
+    def chat(self, *args, **kwargs) -> Dict[str, Any]:
+        self.calls.append((args, kwargs))
+        return self._resp
 
 
 @pytest.fixture
-def mock_huggingface_client(monkeypatch):
-    """Mock HuggingFace client"""
-    mock_client = MagicMock()
-    monkeypatch.setattr("api_wrapper.huggingface_client.HuggingFaceClient", lambda *args, **kwargs: mock_client)
-    return mock_client
+def mock_openai_client(monkeypatch, mock_openai_response):
+    """Stub OpenAI client"""
+    stub = _StubClient(mock_openai_response)
+    monkeypatch.setattr("api_wrapper.openai_client.OpenAIClient", lambda *args, **kwargs: stub)
+    return stub
+
 
+@pytest.fixture
+def mock_huggingface_client(monkeypatch, mock_huggingface_response):
+    """Stub HuggingFace client"""
+    stub = _StubClient(mock_huggingface_response)
+    monkeypatch.setattr("api_wrapper.huggingface_client.HuggingFaceClient", lambda *args, **kwargs: stub)
+    return stub
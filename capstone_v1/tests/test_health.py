@@ -0,0 +1,71 @@
+"""
+Unit tests for HealthChecker
+"""
+
+import time
+
+from api_wrapper.health import HealthChecker
+
+
+class TestHealthChecker:
+    """Test cases for the cached health snapshot"""
+
+    def test_result_is_cached_within_ttl(self, monkeypatch):
+        """Checks within health_ttl reuse one metrics aggregation"""
+        checker = HealthChecker(health_ttl=60)
+        calls = []
+        compute = checker._compute_health
+        monkeypatch.setattr(checker, "_compute_health", lambda: calls.append(1) or compute())
+
+        first = checker.check_health()
+        second = checker.check_health()
+        assert len(calls) == 1
+        assert second["status"] == first["status"]
+        assert second["uptime_seconds"] >= first["uptime_seconds"]
+
+    def test_reads_are_copies(self):
+        """Mutating a returned result does not alter the cached snapshot"""
+        checker = HealthChecker(health_ttl=60)
+        result = checker.check_health()
+        result["status"] = "changed"
+        result["metrics"]["total_requests"] = -1
+        result["issues"].append("changed")
+
+        again = checker.check_health()
+        assert again["status"] != "changed"
+        assert again["metrics"]["total_requests"] != -1
+        assert "changed" not in again["issues"]
+
+    def test_expired_result_is_recomputed(self, monkeypatch):
+        """A snapshot older than health_ttl is recomputed on the next check"""
+        checker = HealthChecker(health_ttl=0)
+        calls = []
+        compute = checker._compute_health
+        monkeypatch.setattr(checker, "_compute_health", lambda: calls.append(1) or compute())
+
+        checker.check_health()
+        checker.check_health()
+        assert len(calls) == 2
+
+    def test_background_refresh(self, monkeypatch):
+        """The refresher recomputes the snapshot until it is stopped"""
+        checker = HealthChecker(health_ttl=0.01)
+        calls = []
+        compute = checker._compute_health
+        monkeypatch.setattr(checker, "_compute_health", lambda: calls.append(1) or compute())
+
+        checker.start_background_refresh()
+        try:
+            assert checker._refresh_thread is not None
+            deadline = time.monotonic() + 5
+            while len(calls) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(calls) >= 3
+            assert checker.check_health()["status"] in ("healthy", "degraded", "unhealthy")
+        finally:
+            checker.stop_background_refresh()
+        assert checker._refresh_thread is None
+
+        stopped_at = len(calls)
+        time.sleep(0.05)
+        assert len(calls) == stopped_at
@@ -0,0 +1,67 @@
+"""
+Unit tests for HuggingFaceClient
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from api_wrapper.exceptions import (
+    APIError,
+    AuthenticationError,
+    ConfigurationError,
+    ModelNotFoundError,
+    RateLimitError,
+)
+from api_wrapper.huggingface_client import HuggingFaceClient, _api_status_error
+
+
+@pytest.fixture
+def hf_client():
+    """HuggingFace API client that never touches the network"""
+    client = HuggingFaceClient(api_key="hf_test")
+    yield client
+    client.close()
+
+
+class TestAsyncClient:
+    """Test cases for the shared httpx.AsyncClient used by achat"""
+
+    def test_new_loop_closes_stale_client(self, hf_client):
+        """A later event loop gets its own client and the old one is closed"""
+        first, _ = asyncio.run(hf_client._get_async_client())
+        second, _ = asyncio.run(hf_client._get_async_client())
+        assert second is not first
+        assert first.is_closed
+        assert not second.is_closed
+
+        asyncio.run(hf_client.aclose())
+        assert second.is_closed
+
+    def test_missing_httpx(self, hf_client, monkeypatch):
+        """achat reports a missing httpx as a configuration problem"""
+        monkeypatch.setitem(sys.modules, "httpx", None)
+        with pytest.raises(ConfigurationError):
+            asyncio.run(hf_client.achat("mistralai/Mistral-7B-Instruct-v0.2", "Hello"))
+
+
+class TestStatusErrors:
+    """Test cases for mapping HTTP error responses to exceptions"""
+
+    @pytest.mark.parametrize("status_code,error_type", [
+        (429, RateLimitError),
+        (401, AuthenticationError),
+        (404, ModelNotFoundError),
+        (500, APIError),
+        (503, APIError),
+    ])
+    def test_status_maps_to_exception(self, status_code, error_type):
+        error = _api_status_error(status_code, {}, "zephyr")
+        assert type(error) is error_type
+        assert error.details["status_code"] == status_code
+
+    def test_rate_limit_retry_after(self):
+        """429 responses carry the Retry-After header, defaulting to 60s"""
+        assert _api_status_error(429, {"Retry-After": "7"}, "zephyr").retry_after == 7
+        assert _api_status_error(429, {}, "zephyr").retry_after == 60
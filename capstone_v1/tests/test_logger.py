@@ -0,0 +1,92 @@
+"""
+Unit tests for the logging helpers
+"""
+
+import json
+import logging
+import time
+
+import pytest
+
+from api_wrapper import logger as logger_module
+from api_wrapper.logger import JSONFormatter, setup_logger
+
+
+def _wait_for_lines(path, count, timeout=5.0):
+    """Wait until the listener thread has written count lines to path"""
+    deadline = time.monotonic() + timeout
+    while True:
+        lines = path.read_text().splitlines() if path.exists() else []
+        if len(lines) >= count or time.monotonic() > deadline:
+            return lines
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def routed_logger_names():
+    """Logger names to configure; their routes and handlers are removed afterwards"""
+    names = []
+    yield names
+    for name in names:
+        logging.getLogger(name).handlers.clear()
+        for handler in logger_module._ROUTES.pop(name, ()):
+            handler.close()
+    for path, handler in list(logger_module._file_handlers.items()):
+        if not any(handler in route for route in logger_module._ROUTES.values()):
+            del logger_module._file_handlers[path]
+
+
+class TestJSONFormatter:
+    """Test cases for JSONFormatter"""
+
+    def test_non_str_keys_in_extra(self):
+        """Extra fields with non-string keys serialize like json.dumps"""
+        record = logging.makeLogRecord({"msg": "hello", "extra": {"counts": {1: 2, None: 3}}})
+        data = json.loads(JSONFormatter().format(record))
+        assert data["message"] == "hello"
+        assert data["counts"] == {"1": 2, "null": 3}
+
+
+class TestQueueRouting:
+    """Test cases for the shared queue listener"""
+
+    def test_records_reach_their_route(self, tmp_path, routed_logger_names):
+        """Each configured logger writes only to its own sinks"""
+        routed_logger_names.extend(["routing_a", "routing_b"])
+        log_a = setup_logger("routing_a", log_file=str(tmp_path / "a.log"))
+        setup_logger("routing_b", log_file=str(tmp_path / "b.log"))
+
+        log_a.info("from a")
+        # Child loggers propagate to the configured parent's queue handler
+        logging.getLogger("routing_b.child").warning("from b child")
+
+        lines_a = _wait_for_lines(tmp_path / "a.log", 1)
+        lines_b = _wait_for_lines(tmp_path / "b.log", 1)
+        assert len(lines_a) == 1 and lines_a[0].endswith("routing_a - INFO - from a")
+        assert len(lines_b) == 1 and lines_b[0].endswith("routing_b.child - WARNING - from b child")
+
+    def test_shared_file_keeps_order(self, tmp_path, routed_logger_names):
+        """Loggers sharing a file share one handler and keep logging order"""
+        routed_logger_names.extend(["routing_c", "routing_d"])
+        path = tmp_path / "shared.log"
+        log_c = setup_logger("routing_c", log_file=str(path), json_format=True)
+        log_d = setup_logger("routing_d", log_file=str(path), json_format=True)
+
+        for i in range(10):
+            (log_c if i % 2 else log_d).info("message %d", i)
+
+        lines = _wait_for_lines(path, 10)
+        assert [json.loads(line)["message"] for line in lines] == [
+            f"message {i}" for i in range(10)
+        ]
+
+    def test_message_args_are_merged_when_queued(self, tmp_path, routed_logger_names):
+        """Arguments mutated after the call do not change the logged message"""
+        routed_logger_names.append("routing_e")
+        log_e = setup_logger("routing_e", log_file=str(tmp_path / "e.log"))
+        items = ["first"]
+        log_e.info("items: %s", items)
+        items.append("second")
+
+        lines = _wait_for_lines(tmp_path / "e.log", 1)
+        assert lines[0].endswith("items: ['first']")
@@ -0,0 +1,64 @@
+"""
+Unit tests for MetricsCollector
+"""
+
+import threading
+
+from api_wrapper.metrics import MetricsCollector
+
+
+def _record_in_threads(collector, count, **kwargs):
+    """Record one request from each of count short-lived threads"""
+    threads = [
+        threading.Thread(target=collector.record_request, kwargs=kwargs)
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestMetricsCollector:
+    """Test cases for the per-thread metric shards"""
+
+    def test_stats_merge_thread_shards(self):
+        """Requests recorded on several threads are all counted"""
+        collector = MetricsCollector()
+        _record_in_threads(collector, 4, provider="openai", model="gpt-4", duration=0.5, tokens_used=10)
+        _record_in_threads(
+            collector, 2, provider="openai", model="gpt-4", duration=0.5,
+            success=False, error_type="RateLimitError",
+        )
+        collector.record_request("huggingface", "zephyr", 1.0)
+
+        stats = collector.get_stats()
+        assert stats["request_counts"] == {"openai:gpt-4": 6, "huggingface:zephyr": 1}
+        assert stats["error_counts"] == {"openai:gpt-4": 2, "openai:gpt-4:RateLimitError": 2}
+        assert stats["total_tokens"] == {"openai:gpt-4": 40}
+        assert stats["total_requests"] == 7
+        assert stats["total_errors"] == 2
+        assert stats["provider_availability"]["openai"]["successful_requests"] == 4
+        assert stats["average_durations"]["openai:gpt-4"] == 0.5
+
+    def test_dead_thread_shards_are_retired(self):
+        """Shards of exited threads are folded into the retired totals"""
+        collector = MetricsCollector()
+        _record_in_threads(collector, 8, provider="openai", model="gpt-4", duration=0.1)
+        collector.record_request("openai", "gpt-4", 0.1)
+
+        # Only the calling thread's shard is still live
+        assert len(collector._shards) == 1
+        assert collector._retired["totals"] == [8, 0]
+        assert collector.get_stats()["request_counts"] == {"openai:gpt-4": 9}
+
+    def test_reset(self):
+        """reset() drops all counts and live threads start new shards"""
+        collector = MetricsCollector()
+        collector.record_request("openai", "gpt-4", 0.1)
+        _record_in_threads(collector, 2, provider="openai", model="gpt-4", duration=0.1)
+        collector.reset()
+        assert collector.get_stats()["total_requests"] == 0
+
+        collector.record_request("openai", "gpt-4", 0.1)
+        assert collector.get_stats()["request_counts"] == {"openai:gpt-4": 1}
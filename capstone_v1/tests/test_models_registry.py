@@ -5,11 +5,8 @@ Unit tests for Models Registry
 import pytest
 from models.models_registry import (
     get_model_info,
-    list_models_by_provider,
     list_models_by_type,
     search_models,
-    get_free_models,
-    get_local_models,
     ModelType,
     AccessMethod,
     ALL_MODELS,
@@ -39,13 +36,11 @@ class TestModelsRegistry:
         model_info = get_model_info("nonexistent-model")
         assert model_info is None
     
-    def test_list_models_by_provider(self):
+    def test_list_models_by_provider(self, huggingface_models, openai_models):
         """Test listing models by provider"""
-        hf_models = list_models_by_provider("huggingface")
-        assert len(hf_models) > 0
-        assert all(m.provider == "huggingface" for m in hf_models)
+        assert len(huggingface_models) > 0
+        assert all(m.provider == "huggingface" for m in huggingface_models)
         
-        openai_models = list_models_by_provider("openai")
         assert len(openai_models) > 0
         assert all(m.provider == "openai" for m in openai_models)
     
@@ -71,15 +66,13 @@ class TestModelsRegistry:
                 any("instruction" in uc.lower() for uc in model.recommended_use_cases)
             )
     
-    def test_get_free_models(self):
+    def test_get_free_models(self, free_models):
         """Test getting free tier models"""
-        free_models = get_free_models()
         assert len(free_models) > 0
         assert all(m.free_tier_available for m in free_models)
     
-    def test_get_local_models(self):
+    def test_get_local_models(self, local_models):
         """Test getting local models"""
-        local_models = get_local_models()
         assert len(local_models) > 0
         assert all(
             m.access_method in [AccessMethod.LOCAL, AccessMethod.BOTH]
@@ -92,20 +85,20 @@ class TestModelsRegistry:
         assert model_info is not None
         
         # Required fields
-        assert hasattr(model_info, "model_id")
-        assert hasattr(model_info, "name")
-        assert hasattr(model_info, "provider")
-        assert hasattr(model_info, "type")
-        assert hasattr(model_info, "description")
-        assert hasattr(model_info, "access_method")
+        assert model_info.model_id
+        assert model_info.name
+        assert model_info.provider
+        assert model_info.type is not None
+        assert model_info.description
+        assert model_info.access_method is not None
     
     def test_api_endpoint_structure(self):
         """Test API endpoint structure"""
         model_info = get_model_info("gpt-3.5-turbo")
         if model_info and model_info.api_endpoint:
-            assert hasattr(model_info.api_endpoint, "url")
-            assert hasattr(model_info.api_endpoint, "method")
-            assert hasattr(model_info.api_endpoint, "auth_required")
+            assert model_info.api_endpoint.url
+            assert model_info.api_endpoint.method
+            assert model_info.api_endpoint.auth_required is not None
     
     def test_all_models_count(self):
         """Test that all models are included"""
@@ -117,7 +110,7 @@ class TestModelsRegistry:
         model_info = get_model_info("gpt-3.5-turbo")
         if model_info and model_info.specs:
             # Specs should have context_window if available
-            assert hasattr(model_info.specs, "context_window")
+            assert model_info.specs.context_window is not None
     
     def test_export_to_dict(self):
         """Test exporting to dictionary"""
@@ -128,3 +121,87 @@ class TestModelsRegistry:
         assert "gpt-3.5-turbo" in data
         assert isinstance(data["gpt-3.5-turbo"], dict)
 
+        # Each call returns its own copy of the cached export
+        data["gpt-3.5-turbo"]["api_endpoint"]["url"] = "changed"
+        del data["gpt-4"]
+        again = export_to_dict()
+        assert again["gpt-3.5-turbo"]["api_endpoint"]["url"] != "changed"
+        assert "gpt-4" in again
+
+    
+    def test_lazy_model_lookup(self):
+        """Test that registry entries are built once and shared"""
+        from models.models_registry import get_hf_model, get_openai_model
+        model_id = "meta-llama/Llama-2-7b-chat-hf"
+        assert get_hf_model(model_id) is HUGGINGFACE_MODELS[model_id]
+        assert get_openai_model("gpt-4") is ALL_MODELS["gpt-4"]
+        assert "nonexistent-model" not in ALL_MODELS
+        with pytest.raises(KeyError):
+            get_hf_model("nonexistent-model")
+    
+    def test_filter_models(self):
+        """Test column-based model filtering"""
+        from models.models_registry import filter_models
+        results = filter_models(min_context=8192, provider="openai", model_type=ModelType.CHAT)
+        expected = [
+            model_id for model_id, model in OPENAI_MODELS.items()
+            if model.type == ModelType.CHAT
+            and model.specs and (model.specs.context_window or 0) >= 8192
+        ]
+        assert results == expected
+        assert len(filter_models()) == len(ALL_MODELS)
+        assert filter_models(provider="unknown") == []
+    
+    def test_registry_items(self):
+        """Test the precomputed item tuples and read-only registries"""
+        from models import models_registry
+        assert models_registry.ALL_ITEMS == tuple(ALL_MODELS.items())
+        assert models_registry.HF_ITEMS == tuple(HUGGINGFACE_MODELS.items())
+        with pytest.raises(TypeError):
+            ALL_MODELS["gpt-4"] = None
+
+    def test_records_copy_and_pickle(self):
+        """Test that records with an endpoint survive deepcopy and pickle"""
+        import copy
+        import pickle
+        model_info = get_model_info("meta-llama/Llama-2-7b-chat-hf")
+        assert copy.deepcopy(model_info) == model_info
+        assert pickle.loads(pickle.dumps(model_info)) == model_info
+
+    def test_asdict_and_replace(self):
+        """Test the record helpers on the active record type"""
+        from models.models_registry import asdict, replace
+        model_info = get_model_info("meta-llama/Llama-2-7b-chat-hf")
+        data = asdict(model_info)
+        assert data["model_id"] == model_info.model_id
+        assert data["api_endpoint"]["url"] == model_info.api_endpoint.url
+        assert data["specs"]["context_window"] == model_info.specs.context_window
+
+        changed = replace(model_info, default_temperature=0.2)
+        assert type(changed) is type(model_info)
+        assert changed.default_temperature == 0.2
+        assert model_info.default_temperature != 0.2
+
+    def test_asdict_matches_without_msgspec(self):
+        """Test that both record types convert to the same dict"""
+        import subprocess
+        import sys
+        from pathlib import Path
+        from models.models_registry import asdict
+        code = (
+            "import sys; sys.modules['msgspec'] = None\n"
+            "from models.models_registry import MSGSPEC_AVAILABLE, asdict, replace, get_model_info\n"
+            "assert not MSGSPEC_AVAILABLE\n"
+            "model_info = get_model_info('meta-llama/Llama-2-7b-chat-hf')\n"
+            "assert replace(model_info, name='x').name == 'x'\n"
+            "print(repr(asdict(model_info)))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        expected = asdict(get_model_info("meta-llama/Llama-2-7b-chat-hf"))
+        assert result.stdout.strip() == repr(expected)
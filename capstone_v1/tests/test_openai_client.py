@@ -0,0 +1,50 @@
+"""
+Unit tests for OpenAIClient
+"""
+
+import pytest
+
+from api_wrapper.exceptions import RateLimitError
+from api_wrapper.openai_client import OpenAIClient
+
+
+@pytest.fixture
+def openai_client():
+    """OpenAI client that never touches the network"""
+    with OpenAIClient(api_key="sk-test") as client:
+        yield client
+
+
+class TestBatchChat:
+    """Test cases for OpenAIClient.batch_chat"""
+
+    def test_failed_request_is_yielded(self, openai_client, monkeypatch, mock_openai_response):
+        """A failing request yields its exception and the batch carries on"""
+        def fake_chat(model, messages, **kwargs):
+            if messages == "fail":
+                raise RateLimitError(retry_after=1)
+            return dict(mock_openai_response, response=messages)
+
+        monkeypatch.setattr(openai_client, "chat", fake_chat)
+        requests = [
+            {"model": "gpt-3.5-turbo", "messages": text}
+            for text in ("one", "fail", "three")
+        ]
+        results = dict(openai_client.batch_chat(requests, max_workers=2))
+
+        assert sorted(results) == [0, 1, 2]
+        assert results[0]["response"] == "one"
+        assert isinstance(results[1], RateLimitError)
+        assert results[2]["response"] == "three"
+
+    def test_unexpected_error_propagates(self, openai_client, monkeypatch):
+        """Errors outside the wrapper's hierarchy are not swallowed"""
+        def fake_chat(model, messages, **kwargs):
+            raise KeyError(messages)
+
+        monkeypatch.setattr(openai_client, "chat", fake_chat)
+        with pytest.raises(KeyError):
+            list(openai_client.batch_chat([{"model": "gpt-4", "messages": "hi"}]))
+
+    def test_empty_batch(self, openai_client):
+        assert list(openai_client.batch_chat([])) == []
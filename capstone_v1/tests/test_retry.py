@@ -0,0 +1,43 @@
+"""
+Unit tests for retry logic
+"""
+
+import pytest
+
+from api_wrapper.exceptions import NetworkError
+from api_wrapper.retry import RetryHandler
+
+
+class TestRetryHandler:
+    """Test cases for RetryHandler"""
+
+    def test_delay_table(self):
+        """Delays grow exponentially and are capped at max_delay"""
+        handler = RetryHandler(max_retries=4, initial_delay=1.0, max_delay=5.0, jitter=False)
+        assert handler._delays() == (1.0, 2.0, 4.0, 5.0)
+
+    def test_delay_table_rebuilt_on_change(self):
+        """Changing the settings after construction rebuilds the table"""
+        handler = RetryHandler(max_retries=2, initial_delay=1.0, jitter=False)
+        assert handler._delays() == (1.0, 2.0)
+
+        handler.max_retries = 3
+        handler.exponential_base = 3.0
+        assert handler._delays() == (1.0, 3.0, 9.0)
+
+        handler.max_delay = 2.0
+        assert handler._delays() == (1.0, 2.0, 2.0)
+
+    def test_execute_uses_current_max_retries(self):
+        """execute() makes max_retries + 1 attempts for the current settings"""
+        handler = RetryHandler(max_retries=1, initial_delay=0.0, jitter=False)
+        handler.max_retries = 3
+        calls = []
+
+        def failing():
+            calls.append(1)
+            raise NetworkError("connection reset")
+
+        with pytest.raises(NetworkError):
+            handler.execute(failing)
+        assert len(calls) == 4
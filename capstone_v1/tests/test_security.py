@@ -0,0 +1,62 @@
+"""
+Unit tests for security helpers
+"""
+
+import pytest
+
+from api_wrapper.exceptions import ValidationError
+from api_wrapper.security import (
+    sanitize_for_logging,
+    validate_max_tokens,
+    validate_temperature,
+)
+
+
+class TestSanitizeForLogging:
+    """Test cases for sanitize_for_logging redaction"""
+
+    def test_key_at_start_is_redacted(self):
+        """A string that is an API key is redacted"""
+        assert sanitize_for_logging("sk-abcdefghijklmnopqrstuvwxyz") == "***REDACTED***"
+
+    def test_key_in_middle_of_string_is_redacted(self):
+        """A key embedded after a long prefix is still redacted"""
+        message = "Authorization header value: sk-abcdefghijklmnopqrstuvwxyz"
+        assert sanitize_for_logging(message) == "***REDACTED***"
+
+    def test_key_in_nested_value_is_redacted(self):
+        """Keys inside values of non-sensitive fields are redacted"""
+        data = {"msg": "token=hf_abcdefghijklmnopqrstuvwxyz", "items": ["ok"]}
+        assert sanitize_for_logging(data) == {"msg": "***REDACTED***", "items": ["ok"]}
+
+    def test_sensitive_keys_are_redacted(self):
+        """Values under sensitive dict keys are redacted regardless of content"""
+        data = {"api_key": "abc", "nested": {"Password": "x", "model": "gpt-4"}}
+        assert sanitize_for_logging(data) == {
+            "api_key": "***REDACTED***",
+            "nested": {"Password": "***REDACTED***", "model": "gpt-4"},
+        }
+
+    def test_plain_text_passes_through(self):
+        """Ordinary strings and scalars are returned unchanged"""
+        assert sanitize_for_logging("a perfectly ordinary log line") == "a perfectly ordinary log line"
+        assert sanitize_for_logging(42) == 42
+
+
+class TestNumericValidators:
+    """Test cases for validate_temperature and validate_max_tokens"""
+
+    def test_accept_keyword_arguments(self):
+        """The public parameter names are part of the interface"""
+        assert validate_temperature(temperature=1) == 1.0
+        assert validate_max_tokens(max_tokens=10) == 10
+
+    @pytest.mark.parametrize("value", [-0.1, 2.5, "hot"])
+    def test_temperature_rejects_invalid(self, value):
+        with pytest.raises(ValidationError):
+            validate_temperature(value)
+
+    @pytest.mark.parametrize("value", [0, 100001, 1.5])
+    def test_max_tokens_rejects_invalid(self, value):
+        with pytest.raises(ValidationError):
+            validate_max_tokens(value)